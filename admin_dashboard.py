@@ -1,16 +1,53 @@
 import customtkinter as ctk
 from tkinter import ttk
 import tkinter.messagebox as messagebox
+from tkinter import filedialog
 from datetime import datetime
-import json
 import os
-
-# Set appearance mode
-ctk.set_appearance_mode("dark")
-ctk.set_default_color_theme("blue")
-
-class InventoryDashboard(ctk.CTk):
-    def __init__(self):
+import queue
+import sys
+import threading
+import time
+from virtual_table import VirtualTable
+from tree_table import TreeTable
+from dashboard_data import DashboardData
+from item_store import InventoryItem, Supplier
+from storage import copy_records, open_app_storage
+from reports import REPORT_TYPES, ReportCache, batched_text, iter_report
+from csv_io import read_csv, write_csv
+from stock import apply_adjustments
+from theme import STATUS_COLORS, ctk_font
+import perf
+from perf import timed
+
+# Report pieces (one per item) inserted into the textbox per event loop turn
+REPORT_BATCH = 200
+
+# Screens of report text kept formatted below the view while it is filling
+REPORT_PAGES_AHEAD = 3
+
+# Imported records added to the collections per event loop turn
+IMPORT_CHUNK = 2000
+
+# Time from creating the dashboard to its first drawn frame we aim to stay under
+FIRST_PAINT_TARGET_MS = 300
+
+# Table engines selectable with HARDTRACK_TABLE: pooled CTk row widgets or a ttk.Treeview
+TABLE_ENGINES = {"virtual": VirtualTable, "tree": TreeTable}
+
+# Record field behind each sortable table column
+SORT_FIELDS = {
+    "ID": "id", "Supplier ID": "id", "Product Name": "name", "Name": "name", "Category": "category",
+    "Quantity": "quantity", "Price": "price", "Status": "status", "Contact": "contact", "Email": "email"
+}
+
+class InventoryDashboard(ctk.CTk, DashboardData):
+    def __init__(self, storage=None, preloaded=None, table_engine=None):
+        self.started = time.perf_counter()
+        # Set appearance mode here rather than at import, so importing this
+        # module stays cheap for windows that never open the dashboard
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
         super().__init__()
 
         self.title("HardTrack")
@@ -20,9 +57,46 @@ class InventoryDashboard(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
-        # Data file for persistence
-        self.data_file = "inventory_data.json"
-        self.load_data()
+        # Storage and (inventory, suppliers) may come preloaded from the login window
+        self.storage = storage if storage is not None else open_app_storage()
+        self.preloaded = preloaded
+        # Bumped on every change to the inventory so cached reports go stale
+        self.data_version = 0
+        self.report_cache = ReportCache()
+        # The data is read on a background thread while the window shell shows
+        self.loading = True
+        self.loading_frame = None
+        # Why the data could not be read, reported instead of opening on empty data
+        self.load_error = None
+        # Bumped on every change to the suppliers, like data_version for the inventory
+        self.suppliers_version = 0
+        # Set by the Logout button so the login window knows to show again
+        self.logged_out = False
+        self.table_class = TABLE_ENGINES[table_engine or os.environ.get("HARDTRACK_TABLE", "virtual")]
+
+        # Each section's frame is built once, then hidden and shown; the data
+        # version it last showed tells whether it needs a refresh
+        self.current_section = None
+        self.current_table = None
+        self.section_frames = {}
+        self.section_tables = {}
+        self.section_versions = {}
+        self.stats_labels = {}
+        # Per section: (field, descending) of the column its table is sorted
+        # by, and its column headings with a function changing their text
+        self.table_sorts = {}
+        self.table_headings = {}
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(250, self.check_save_errors)
+
+        # Pending debounced search
+        self.search_job = None
+        # Report being filled in batches, its next scheduled batch and the
+        # batches shown so far
+        self.report_job = None
+        self.report_batches = None
+        self.report_key = None
+        self.report_shown = []
 
         # Create sidebar
         self.create_sidebar()
@@ -31,45 +105,108 @@ class InventoryDashboard(ctk.CTk):
         # Create main content area
         self.create_main_content()
 
-    def load_data(self):
-        """Load data from JSON file or use default sample data"""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.inventory_data = data.get("inventory", [])
-                    self.suppliers_data = data.get("suppliers", [])
-            except:
-                self.load_default_data()
-        else:
-            self.load_default_data()
-
-    def load_default_data(self):
-        """Load default sample data"""
-        self.inventory_data = [
-        ]
-
-        self.suppliers_data = [
-        ]
-
-    def save_data(self):
-        """Save data to JSON file"""
-        data = {
-            "inventory": self.inventory_data,
-            "suppliers": self.suppliers_data
-        }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2)
-
-    def update_status(self, item):
-        """Auto-update status based on quantity"""
-        quantity = item["quantity"]
-        if quantity == 0:
-            item["status"] = "Out of Stock"
-        elif quantity <= 10:
-            item["status"] = "Low Stock"
+        self.after_idle(self.record_first_paint)
+        if perf.ENABLED:
+            self.lag_monitor = perf.LoopLagMonitor(self)
+            self.update_perf_label()
+        self.start_loading()
+
+    def start_loading(self):
+        """Read the data on a background thread; sections show a progress bar meanwhile"""
+        thread = threading.Thread(target=self.load_in_background, args=(self.preloaded,), daemon=True)
+        self.preloaded = None
+        thread.start()
+        self.after(50, self.poll_loading, thread)
+
+    def load_in_background(self, preloaded):
+        """Loading thread: read the data, keeping a failure for poll_loading to report"""
+        try:
+            self.load_data(preloaded)
+        except Exception as error:
+            self.load_error = error
+
+    def poll_loading(self, thread):
+        """Show the requested section once the background load has finished"""
+        if thread.is_alive():
+            self.after(50, self.poll_loading, thread)
+            return
+        if self.load_error is not None:
+            # The storage was never attached, so closing writes nothing over the file
+            messagebox.showerror("Load Failed", f"The inventory data could not be read: {self.load_error}")
+            self.on_close()
+            return
+        self.loading = False
+        self.log_startup("Data ready")
+        self.loading_frame.destroy()
+        self.show_section(self.current_section)
+
+    def record_first_paint(self):
+        """Measure the time until the window shell is first drawn"""
+        self.update_idletasks()
+        self.log_startup("First paint", FIRST_PAINT_TARGET_MS)
+
+    def log_startup(self, event, target_ms=None):
+        """Print a startup milestone to stderr when HARDTRACK_STARTUP_TIMING=1"""
+        if os.environ.get("HARDTRACK_STARTUP_TIMING") != "1":
+            return
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        message = f"{event} after {elapsed_ms:.0f} ms"
+        if target_ms is not None:
+            message += f" (target {target_ms} ms{', MISSED' if elapsed_ms > target_ms else ''})"
+        print(message, file=sys.stderr)
+
+    def on_close(self):
+        """Finish pending writes before the window goes away"""
+        self.storage.close()
+        if perf.ENABLED:
+            perf.tracer.dump(perf.TRACE_PATH)
+        self.destroy()
+
+    def logout(self):
+        """Close the dashboard and go back to the login window"""
+        self.logged_out = True
+        self.on_close()
+
+    def update_perf_label(self):
+        """Refresh the performance readout twice a second"""
+        self.perf_label.configure(text=perf.tracer.summary())
+        self.after(500, self.update_perf_label)
+
+    def check_save_errors(self):
+        """Report failures of the background writer"""
+        try:
+            error = self.storage.errors.get_nowait()
+        except queue.Empty:
+            pass
         else:
-            item["status"] = "In Stock"
+            messagebox.showerror("Save Failed", f"Changes could not be saved: {error}")
+        self.after(250, self.check_save_errors)
+
+    @timed("adjust_stock")
+    def adjust_stock(self, adjustments):
+        """Apply many (id, quantity delta) pairs at once, e.g. from a till or a receiving scan
+
+        The batch is all or nothing: a delta that is not a whole number, an
+        unknown id or a quantity going below zero raises ValueError or
+        KeyError and changes nothing. Only the
+        touched items are re-indexed, and the batch is persisted as one write.
+        """
+        with self.storage.lock:
+            items = apply_adjustments(self.inventory_data, adjustments)
+        for item in items:
+            self.reindex_item(item)
+        self.storage.write_batch([("put_item", item) for item in items])
+
+        if self.current_section in ("dashboard", "inventory") and self.current_table is not None:
+            if self.current_section in self.table_sorts:
+                # Rows may move; show the new order once for the whole batch
+                self.refresh_section(self.current_section)
+            else:
+                for item in items:
+                    self.current_table.update_row(item)
+            self.update_stats_cards()
+            self.section_versions[self.current_section] = self.data_version
+        return items
 
     def create_sidebar(self):
         """Create left sidebar with navigation"""
@@ -81,7 +218,7 @@ class InventoryDashboard(ctk.CTk):
         logo_label = ctk.CTkLabel(
             sidebar,
             text="📦 HardTrack",
-            font=("Arial", 20, "bold"),
+            font=ctk_font(20, "bold"),
             text_color="#00a8ff"
         )
         logo_label.pack(pady=20, padx=20)
@@ -99,15 +236,11 @@ class InventoryDashboard(ctk.CTk):
             ("🚪 Logout", self.logout)
         ]
 
-        def logout(self):
-            self.destroy()
-            import login
-
         for text, command in nav_items:
             btn = ctk.CTkButton(
                 sidebar,
                 text=text,
-                font=("Arial", 14),
+                font=ctk_font(14),
                 command=command,
                 fg_color="#2d2d2d",
                 hover_color="#3d3d3d",
@@ -123,7 +256,7 @@ class InventoryDashboard(ctk.CTk):
         version_label = ctk.CTkLabel(
             footer_frame,
             text="ADMIN",
-            font=("Arial", 15),
+            font=ctk_font(15),
             text_color="#808080"
         )
         version_label.pack()
@@ -158,7 +291,7 @@ class InventoryDashboard(ctk.CTk):
         self.title_label = ctk.CTkLabel(
             header,
             text="Dashboard",
-            font=("Arial", 28, "bold"),
+            font=ctk_font(28, "bold"),
             text_color="#ffffff"
         )
         self.title_label.pack(side="left", padx=20, pady=20)
@@ -167,189 +300,278 @@ class InventoryDashboard(ctk.CTk):
         time_label = ctk.CTkLabel(
             header,
             text=f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            font=("Arial", 12),
+            font=ctk_font(12),
             text_color="#808080"
         )
         time_label.pack(side="right", padx=20, pady=20)
 
+        # Performance readout, shown when HARDTRACK_PERF=1
+        self.perf_label = None
+        if perf.ENABLED:
+            self.perf_label = ctk.CTkLabel(
+                header,
+                text="",
+                font=ctk_font(11),
+                text_color="#ffaa00"
+            )
+            self.perf_label.pack(side="right", padx=10, pady=20)
+
     def create_stats_cards(self, parent):
         """Create statistics cards"""
         cards_frame = ctk.CTkFrame(parent, fg_color="transparent")
         cards_frame.pack(fill="x", pady=(0, 20))
 
-        stats = [
-            ("Total Products", str(len(self.inventory_data)), "#00a8ff"),
-            ("In Stock", str(sum(1 for item in self.inventory_data if item['status'] == 'In Stock')), "#00cc88"),
-            ("Low Stock", str(sum(1 for item in self.inventory_data if item['status'] == 'Low Stock')), "#ffaa00"),
-            ("Out of Stock", str(sum(1 for item in self.inventory_data if item['status'] == 'Out of Stock')), "#ff5555"),
-        ]
-
-        for i, (label, value, color) in enumerate(stats):
+        for i, (label, value, color) in enumerate(self.stats_values()):
             card = ctk.CTkFrame(cards_frame, fg_color="#1a1a1a", corner_radius=10)
             card.pack(side="left", fill="both", expand=True, padx=(0, 15) if i < 3 else 0)
 
             value_label = ctk.CTkLabel(
                 card,
                 text=value,
-                font=("Arial", 32, "bold"),
+                font=ctk_font(32, "bold"),
                 text_color=color
             )
             value_label.pack(pady=(15, 5), padx=20)
+            self.stats_labels[label] = value_label
 
             name_label = ctk.CTkLabel(
                 card,
                 text=label,
-                font=("Arial", 12),
+                font=ctk_font(12),
                 text_color="#808080"
             )
             name_label.pack(pady=(0, 15), padx=20)
 
-    def create_inventory_table(self, parent, data, columns, show_status=True, editable=False):
-        """Create inventory table display with optional edit/delete buttons"""
-        # Table header
-        header_frame = ctk.CTkFrame(parent, fg_color="#1a1a1a")
-        header_frame.pack(fill="x", pady=(0, 10))
+    def update_stats_cards(self):
+        """Update only the statistics cards whose value changed"""
+        for label, value, color in self.stats_values():
+            value_label = self.stats_labels.get(label)
+            if value_label is not None and value_label.cget("text") != value:
+                value_label.configure(text=value)
 
+    @timed("create_inventory_table")
+    def create_inventory_table(self, parent, data, columns, show_status=True, editable=False, section=None):
+        """Create inventory table display with optional edit/delete buttons
+
+        Tables given a section sort by a column when its header is clicked.
+        """
         if show_status:
             widths = [70, 150, 130, 80, 100, 100, 100]
         else:
             widths = [90, 150, 120, 120, 120, 100]
 
-        headers_to_show = columns + (["Actions"] if editable else [])
-
-        for header, width in zip(headers_to_show, widths):
-            label = ctk.CTkLabel(
-                header_frame,
-                text=header,
-                font=("Arial", 12, "bold"),
-                text_color="#00a8ff",
-                width=width
-            )
-            label.pack(side="left", padx=10, pady=10)
-
-        # Scrollable content frame
-        table_scroll = ctk.CTkScrollableFrame(
-            parent,
-            fg_color="#1a1a1a",
-            corner_radius=10
-        )
-        table_scroll.pack(fill="both", expand=True)
-
-        # Table rows
-        for item in data:
-            row_frame = ctk.CTkFrame(table_scroll, fg_color="#252525", corner_radius=5)
-            row_frame.pack(fill="x", padx=5, pady=5)
-
-            status_color_map = {
-                "In Stock": "#00cc88",
-                "Low Stock": "#ffaa00",
-                "Out of Stock": "#ff5555",
-                "Active": "#00cc88",
-                "Inactive": "#ff5555"
-            }
-
-            # Prepare values based on data type
-            if "status" in item and show_status:
-                values = [item.get("id", ""), item.get("name", ""), item.get("category", ""),
-                          str(item.get("quantity", "")), f"${item['price']:.2f}", item["status"]]
-            else:
-                values = [item.get("id", ""), item.get("name", ""), item.get("contact", ""),
-                          item.get("email", ""), item["status"]]
-
-            for value, width, header in zip(values, widths, columns):
-                if header == "Status":
-                    color = status_color_map.get(value, "#ffffff")
-                    label = ctk.CTkLabel(
-                        row_frame,
-                        text=value,
-                        font=("Arial", 11),
-                        text_color=color,
-                        width=width
-                    )
-                else:
-                    label = ctk.CTkLabel(
-                        row_frame,
-                        text=value,
-                        font=("Arial", 11),
-                        text_color="#ffffff",
-                        width=width
-                    )
-                label.pack(side="left", padx=10, pady=12)
-
-            # Add action buttons if editable
-            if editable:
-                edit_btn = ctk.CTkButton(
-                    row_frame,
-                    text="✏️ Edit",
-                    font=("Arial", 10),
-                    width=40,
-                    height=25,
-                    fg_color="#00a8ff",
-                    hover_color="#0088cc",
-                    command=lambda i=item: self.edit_item(i)
+        # Table header; the tree engine draws its own column headings
+        if self.table_class is VirtualTable:
+            header_frame = ctk.CTkFrame(parent, fg_color="#1a1a1a")
+            header_frame.pack(fill="x", pady=(0, 10))
+
+            headers_to_show = columns + (["Actions"] if editable else [])
+
+            header_labels = []
+            for column, (header, width) in enumerate(zip(headers_to_show, widths)):
+                label = ctk.CTkLabel(
+                    header_frame,
+                    text=header,
+                    font=ctk_font(12, "bold"),
+                    text_color="#00a8ff",
+                    width=width
                 )
-                edit_btn.pack(side="left", padx=5, pady=12)
-
-                del_btn = ctk.CTkButton(
-                    row_frame,
-                    text="🗑️ Delete",
-                    font=("Arial", 10),
-                    width=40,
-                    height=25,
-                    fg_color="#ff5555",
-                    hover_color="#cc4444",
-                    command=lambda i=item: self.delete_item(i)
-                )
-                del_btn.pack(side="left", padx=5, pady=12)
-
+                label.pack(side="left", padx=10, pady=10)
+                if section is not None and column < len(columns):
+                    label.configure(cursor="hand2")
+                    label.bind("<Button-1>", lambda e, c=column: self.sort_table(section, c))
+                header_labels.append(label)
+
+        # Action buttons if editable
+        actions = []
+        if editable:
+            if section == "suppliers":
+                edit, delete = self.edit_supplier, self.delete_supplier
+            else:
+                edit, delete = self.edit_item, self.delete_item
+            actions = [
+                ("✏️ Edit", "#00a8ff", "#0088cc", edit),
+                ("🗑️ Delete", "#ff5555", "#cc4444", delete),
+            ]
+
+        row_values = lambda item: self.table_row_values(item, show_status)
+        status_column = columns.index("Status") if "Status" in columns else None
+        if self.table_class is TreeTable:
+            # Rows live in the Treeview; actions come from a right-click menu
+            sort_command = None if section is None else lambda column: self.sort_table(section, column)
+            table = TreeTable(parent, data, columns, widths[:len(columns)], row_values,
+                              status_column=status_column, status_colors=STATUS_COLORS, actions=actions,
+                              sort_command=sort_command)
+            set_heading = table.set_heading
+        else:
+            # Virtualized rows: only the rows in view get widgets
+            table = VirtualTable(parent, data, widths[:len(columns)], row_values,
+                                 status_column=status_column, status_colors=STATUS_COLORS, actions=actions)
+            set_heading = lambda column, text: header_labels[column].configure(text=text)
+        if section is not None:
+            self.table_headings[section] = (columns, set_heading)
+        table.pack(fill="both", expand=True)
+        return table
+
+    def table_source(self, section):
+        """All rows of a section's table, in the order it is sorted by"""
+        collection = "suppliers" if section == "suppliers" else "inventory"
+        sort = self.table_sorts.get(section)
+        if sort is None:
+            return self.suppliers_data if collection == "suppliers" else self.inventory_data
+        field, descending = sort
+        return self.sort_index(collection, field).view(descending)
+
+    def sort_position(self, section, item):
+        """Row of an item in a section's sorted table, or None if it is unsorted"""
+        sort = self.table_sorts.get(section)
+        if sort is None:
+            return None
+        field, descending = sort
+        collection = "suppliers" if section == "suppliers" else "inventory"
+        return self.sort_index(collection, field).position(item, descending)
+
+    def sort_table(self, section, column):
+        """Sort a section's table by a column, reversing it on a second click"""
+        columns, set_heading = self.table_headings[section]
+        field = SORT_FIELDS[columns[column]]
+        descending = self.table_sorts.get(section) == (field, False)
+        self.table_sorts[section] = (field, descending)
+        for i, heading in enumerate(columns):
+            set_heading(i, f"{heading} {'▼' if descending else '▲'}" if i == column else heading)
+
+        if section == "inventory":
+            # Keeps the search and sorts its results
+            self.apply_search()
+        else:
+            table = self.section_tables[section]
+            table.top = 0
+            table.set_data(self.table_source(section))
+
+    def table_row_values(self, item, show_status=True):
+        """Prepare the displayed values of a table row based on data type"""
+        if "status" in item and show_status:
+            return [item.get("id", ""), item.get("name", ""), item.get("category", ""),
+                    str(item.get("quantity", "")), f"${item['price']:.2f}", item["status"]]
+        return [item.get("id", ""), item.get("name", ""), item.get("contact", ""),
+                item.get("email", ""), item["status"]]
+
+    @timed("show_section")
     def show_section(self, section):
-        """Show different sections"""
-        # Clear previous content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        """Show a section, building it on first use and refreshing it if its data changed"""
+        if self.current_section in self.section_frames:
+            self.section_frames[self.current_section].pack_forget()
+        self.current_section = section
 
         # Update title
         self.title_label.configure(text=section.capitalize())
 
+        if self.loading:
+            self.show_loading()
+            return
+
+        frame = self.section_frames.get(section)
+        if frame is None:
+            frame = self.section_frames[section] = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+            builders = {
+                "dashboard": self.show_dashboard,
+                "inventory": self.show_inventory,
+                "reports": self.show_reports,
+                "suppliers": self.show_suppliers,
+            }
+            self.section_tables[section] = builders[section](frame)
+        elif self.section_versions[section] != self.section_version(section):
+            self.refresh_section(section)
+        self.section_versions[section] = self.section_version(section)
+        self.current_table = self.section_tables[section]
+        frame.pack(fill="both", expand=True)
+
+    def section_version(self, section):
+        """Version of the data a section displays"""
+        return self.suppliers_version if section == "suppliers" else self.data_version
+
+    def refresh_section(self, section):
+        """Bring an already built section up to date with the current data"""
         if section == "dashboard":
-            self.show_dashboard()
+            self.update_stats_cards()
+            self.section_tables[section].set_data(self.table_source(section))
         elif section == "inventory":
-            self.show_inventory()
+            self.apply_search()
         elif section == "reports":
-            self.show_reports()
+            self.generate_report(self.report_menu.get())
         elif section == "suppliers":
-            self.show_suppliers()
+            self.section_tables[section].set_data(self.table_source(section))
+
+    def show_loading(self):
+        """Placeholder shown while the data is still being read"""
+        if self.loading_frame is not None:
+            return
+        self.loading_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self.loading_frame.pack(fill="both", expand=True)
+
+        loading_label = ctk.CTkLabel(
+            self.loading_frame,
+            text="Loading inventory...",
+            font=ctk_font(14),
+            text_color="#808080"
+        )
+        loading_label.pack(pady=(120, 10))
+
+        progress = ctk.CTkProgressBar(self.loading_frame, mode="indeterminate", width=300)
+        progress.pack()
+        progress.start()
+
+    def patch_section(self, section, action, item):
+        """Reflect one added, edited or removed row without rebuilding the section"""
+        views = ("dashboard", "inventory") if section == "inventory" else (section,)
+        if self.current_section not in views or self.current_table is None:
+            # Hidden sections catch up through their data version when shown
+            return
+
+        if section == "inventory" and self.current_table.data is not self.table_source(self.current_section):
+            # The table shows search results, re-run the search instead
+            self.apply_search()
+        elif action == "insert":
+            self.current_table.insert_row(item, self.sort_position(self.current_section, item))
+        elif action == "remove":
+            self.current_table.remove_row(item)
+        else:
+            self.current_table.update_row(item, self.sort_position(self.current_section, item))
 
- 
+        if section == "inventory":
+            self.update_stats_cards()
+        self.section_versions[self.current_section] = self.section_version(self.current_section)
 
-    def show_dashboard(self):
-        """Display dashboard view"""
+    def show_dashboard(self, parent):
+        """Build the dashboard view into parent and return its table"""
         # Stats cards
-        self.create_stats_cards(self.content_frame)
+        self.create_stats_cards(parent)
 
         # Section label
         section_label = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Inventory Overview",
-            font=("Arial", 18, "bold"),
+            font=ctk_font(18, "bold"),
             text_color="#ffffff"
         )
         section_label.pack(anchor="w", pady=(10, 15))
 
         # Inventory table
-        self.create_inventory_table(self.content_frame, self.inventory_data,
-                                    ["ID", "Product Name", "Category", "Quantity", "Price", "Status"])
+        return self.create_inventory_table(
+            parent, self.inventory_data,
+            ["ID", "Product Name", "Category", "Quantity", "Price", "Status"],
+            section="dashboard")
 
-    def show_inventory(self):
-        """Display inventory view"""
+    def show_inventory(self, parent):
+        """Build the inventory view into parent and return its table"""
         # Top controls frame
-        controls_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        controls_frame = ctk.CTkFrame(parent, fg_color="transparent")
         controls_frame.pack(fill="x", pady=(0, 15))
 
         section_label = ctk.CTkLabel(
             controls_frame,
             text="Full Inventory List",
-            font=("Arial", 18, "bold"),
+            font=ctk_font(18, "bold"),
             text_color="#ffffff"
         )
         section_label.pack(side="left", anchor="w")
@@ -358,13 +580,34 @@ class InventoryDashboard(ctk.CTk):
         add_btn = ctk.CTkButton(
             controls_frame,
             text="➕ Add Product",
-            font=("Arial", 12),
+            font=ctk_font(12),
             fg_color="#00a8ff",
             hover_color="#0088cc",
             command=self.add_item_dialog
         )
         add_btn.pack(side="right", padx=5)
 
+        # CSV import/export buttons
+        export_btn = ctk.CTkButton(
+            controls_frame,
+            text="⬇ Export CSV",
+            font=ctk_font(12),
+            fg_color="#2d2d2d",
+            hover_color="#3d3d3d",
+            command=lambda: self.export_csv("inventory")
+        )
+        export_btn.pack(side="right", padx=5)
+
+        import_btn = ctk.CTkButton(
+            controls_frame,
+            text="⬆ Import CSV",
+            font=ctk_font(12),
+            fg_color="#2d2d2d",
+            hover_color="#3d3d3d",
+            command=lambda: self.import_csv("inventory")
+        )
+        import_btn.pack(side="right", padx=5)
+
         # Search box
         search_frame = ctk.CTkFrame(controls_frame, fg_color="transparent")
         search_frame.pack(side="right", padx=10)
@@ -372,7 +615,7 @@ class InventoryDashboard(ctk.CTk):
         search_label = ctk.CTkLabel(
             search_frame,
             text="Search:",
-            font=("Arial", 12),
+            font=ctk_font(12),
             text_color="#ffffff"
         )
         search_label.pack(side="left", padx=5)
@@ -382,21 +625,45 @@ class InventoryDashboard(ctk.CTk):
             search_frame,
             textvariable=self.search_var,
             placeholder_text="Product name or ID",
-            font=("Arial", 11),
+            font=ctk_font(11),
             width=200
         )
         search_entry.pack(side="left", padx=5)
         self.search_var.trace("w", self.filter_inventory)
 
         # Inventory table with edit/delete
-        self.create_inventory_table(self.content_frame, self.inventory_data,
-                                    ["ID", "Product Name", "Category", "Quantity", "Price", "Status"],
-                                    editable=True)
+        return self.create_inventory_table(
+            parent, self.inventory_data,
+            ["ID", "Product Name", "Category", "Quantity", "Price", "Status"],
+            editable=True, section="inventory")
 
     def filter_inventory(self, *args):
-        """Filter inventory based on search"""
-        # This would require refreshing the table - for now, it's a placeholder
-        pass
+        """Filter inventory based on search, debounced while typing"""
+        if self.search_job is not None:
+            self.after_cancel(self.search_job)
+        self.search_job = self.after(150, self.apply_search)
+
+    @timed("apply_search")
+    def apply_search(self):
+        """Show the items matching the search box in the inventory table"""
+        self.search_job = None
+        table = self.section_tables.get("inventory")
+        if table is None:
+            return
+
+        query = self.search_var.get().strip()
+        if not query:
+            results = self.table_source("inventory")
+        else:
+            results = self.search(query)
+            sort = self.table_sorts.get("inventory")
+            if sort is not None:
+                # Matches are few next to the catalog; order them by the index's keys
+                field, descending = sort
+                results = sorted(results, key=self.sort_index("inventory", field).key, reverse=descending)
+
+        table.top = 0
+        table.set_data(results)
 
     def add_item_dialog(self):
         """Show dialog to add new product"""
@@ -415,7 +682,7 @@ class InventoryDashboard(ctk.CTk):
         }
 
         for i, (field, var) in enumerate(fields.items()):
-            label = ctk.CTkLabel(dialog, text=field, font=("Arial", 12), text_color="#ffffff")
+            label = ctk.CTkLabel(dialog, text=field, font=ctk_font(12), text_color="#ffffff")
             label.pack(pady=(15 if i == 0 else 10, 5), padx=20, anchor="w")
 
             if field == "Category":
@@ -423,36 +690,43 @@ class InventoryDashboard(ctk.CTk):
                     dialog,
                     values=["Electronics", "Accessories", "Hardware"],
                     variable=var,
-                    font=("Arial", 11)
+                    font=ctk_font(11)
                 )
             else:
                 entry = ctk.CTkEntry(dialog, textvariable=var, placeholder_text=f"Enter {field.lower()}",
-                                     font=("Arial", 11))
+                                     font=ctk_font(11))
 
             entry.pack(fill="x", padx=20, pady=5)
 
         # Submit button
+        @timed("add_item_dialog.submit")
         def submit():
             try:
-                new_item = {
-                    "id": fields["ID"].get(),
-                    "name": fields["Product Name"].get(),
-                    "category": fields["Category"].get(),
-                    "quantity": int(fields["Quantity"].get()),
-                    "price": float(fields["Price"].get()),
-                    "status": "In Stock"
-                }
+                new_item = InventoryItem(
+                    id=fields["ID"].get(),
+                    name=fields["Product Name"].get(),
+                    category=fields["Category"].get(),
+                    quantity=int(fields["Quantity"].get()),
+                    price=float(fields["Price"].get()),
+                    status="In Stock"
+                )
 
                 if not new_item["id"] or not new_item["name"]:
                     messagebox.showerror("Error", "ID and Product Name are required!")
                     return
 
+                if new_item["id"] in self.inventory_data:
+                    messagebox.showerror("Error", f"A product with ID {new_item['id']} already exists!")
+                    return
+
                 self.update_status(new_item)
-                self.inventory_data.append(new_item)
-                self.save_data()
+                with self.storage.lock:
+                    new_item = self.inventory_data.add(new_item)
+                self.index_item(new_item)
+                self.storage.put_item(new_item)
                 messagebox.showinfo("Success", "Product added successfully!")
                 dialog.destroy()
-                self.show_section("inventory")
+                self.patch_section("inventory", "insert", new_item)
             except ValueError:
                 messagebox.showerror("Error", "Quantity must be a number and Price must be a decimal!")
 
@@ -462,7 +736,7 @@ class InventoryDashboard(ctk.CTk):
             command=submit,
             fg_color="#00a8ff",
             hover_color="#0088cc",
-            font=("Arial", 12)
+            font=ctk_font(12)
         )
         submit_btn.pack(pady=20, padx=20, fill="x")
 
@@ -482,7 +756,7 @@ class InventoryDashboard(ctk.CTk):
         }
 
         for i, (field, var) in enumerate(fields.items()):
-            label = ctk.CTkLabel(dialog, text=field, font=("Arial", 12), text_color="#ffffff")
+            label = ctk.CTkLabel(dialog, text=field, font=ctk_font(12), text_color="#ffffff")
             label.pack(pady=(15 if i == 0 else 10, 5), padx=20, anchor="w")
 
             if field == "Category":
@@ -490,24 +764,31 @@ class InventoryDashboard(ctk.CTk):
                     dialog,
                     values=["Electronics", "Accessories", "Hardware"],
                     variable=var,
-                    font=("Arial", 11)
+                    font=ctk_font(11)
                 )
             else:
-                entry = ctk.CTkEntry(dialog, textvariable=var, font=("Arial", 11))
+                entry = ctk.CTkEntry(dialog, textvariable=var, font=ctk_font(11))
 
             entry.pack(fill="x", padx=20, pady=5)
 
+        @timed("edit_item.submit")
         def submit():
             try:
-                item["name"] = fields["Product Name"].get()
-                item["category"] = fields["Category"].get()
-                item["quantity"] = int(fields["Quantity"].get())
-                item["price"] = float(fields["Price"].get())
-                self.update_status(item)
-                self.save_data()
+                name = fields["Product Name"].get()
+                category = fields["Category"].get()
+                quantity = int(fields["Quantity"].get())
+                price = float(fields["Price"].get())
+                with self.storage.lock:
+                    item["name"] = name
+                    item["category"] = category
+                    item["quantity"] = quantity
+                    item["price"] = price
+                    self.update_status(item)
+                self.reindex_item(item)
+                self.storage.put_item(item)
                 messagebox.showinfo("Success", "Product updated successfully!")
                 dialog.destroy()
-                self.show_section("inventory")
+                self.patch_section("inventory", "update", item)
             except ValueError:
                 messagebox.showerror("Error", "Invalid input values!")
 
@@ -517,58 +798,268 @@ class InventoryDashboard(ctk.CTk):
             command=submit,
             fg_color="#00a8ff",
             hover_color="#0088cc",
-            font=("Arial", 12)
+            font=ctk_font(12)
         )
         submit_btn.pack(pady=20, padx=20, fill="x")
 
+    @timed("delete_item")
     def delete_item(self, item):
         """Delete product with confirmation"""
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {item['name']}?"):
-            self.inventory_data.remove(item)
-            self.save_data()
+            with self.storage.lock:
+                self.inventory_data.remove(item)
+            self.unindex_item(item)
+            self.storage.delete_item(item)
             messagebox.showinfo("Success", "Product deleted successfully!")
-            self.show_section("inventory")
+            self.patch_section("inventory", "remove", item)
+
+    def edit_supplier(self, supplier):
+        """Show dialog to edit supplier"""
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Edit Supplier")
+        dialog.geometry("450x500")
+        dialog.grab_set()
+
+        fields = {
+            "ID": ctk.StringVar(value=supplier["id"]),
+            "Name": ctk.StringVar(value=supplier["name"]),
+            "Contact": ctk.StringVar(value=supplier["contact"]),
+            "Email": ctk.StringVar(value=supplier["email"]),
+        }
+
+        for i, (field, var) in enumerate(fields.items()):
+            label = ctk.CTkLabel(dialog, text=field, font=ctk_font(12), text_color="#ffffff")
+            label.pack(pady=(15 if i == 0 else 10, 5), padx=20, anchor="w")
+
+            entry = ctk.CTkEntry(dialog, textvariable=var, font=ctk_font(11))
+            if field == "ID":
+                entry.configure(state="disabled")
+            entry.pack(fill="x", padx=20, pady=5)
+
+        # Status
+        label = ctk.CTkLabel(dialog, text="Status", font=ctk_font(12), text_color="#ffffff")
+        label.pack(pady=10, padx=20, anchor="w")
+
+        status_var = ctk.StringVar(value=supplier["status"])
+        status_menu = ctk.CTkOptionMenu(
+            dialog,
+            values=["Active", "Inactive"],
+            variable=status_var,
+            font=ctk_font(11)
+        )
+        status_menu.pack(fill="x", padx=20, pady=5)
+
+        @timed("edit_supplier.submit")
+        def submit():
+            name = fields["Name"].get()
+            if not name:
+                messagebox.showerror("Error", "Name is required!")
+                return
+
+            with self.storage.lock:
+                supplier["name"] = name
+                supplier["contact"] = fields["Contact"].get()
+                supplier["email"] = fields["Email"].get()
+                supplier["status"] = status_var.get()
+            self.reindex_supplier(supplier)
+            self.storage.put_supplier(supplier)
+            messagebox.showinfo("Success", "Supplier updated successfully!")
+            dialog.destroy()
+            self.patch_section("suppliers", "update", supplier)
+
+        submit_btn = ctk.CTkButton(
+            dialog,
+            text="Update Supplier",
+            command=submit,
+            fg_color="#00a8ff",
+            hover_color="#0088cc",
+            font=ctk_font(12)
+        )
+        submit_btn.pack(pady=20, padx=20, fill="x")
 
-    def show_reports(self):
-        """Display reports view"""
+    @timed("delete_supplier")
+    def delete_supplier(self, supplier):
+        """Delete supplier with confirmation"""
+        if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {supplier['name']}?"):
+            with self.storage.lock:
+                self.suppliers_data.remove(supplier)
+            self.unindex_supplier(supplier)
+            self.storage.delete_supplier(supplier)
+            messagebox.showinfo("Success", "Supplier deleted successfully!")
+            self.patch_section("suppliers", "remove", supplier)
+
+    def show_progress(self, title, text):
+        """Small window with a progress bar for a background job"""
+        window = ctk.CTkToplevel(self)
+        window.title(title)
+        window.geometry("380x120")
+        window.resizable(False, False)
+        # The job reports into the window, so it stays open until the job ends
+        window.protocol("WM_DELETE_WINDOW", lambda: None)
+
+        window.label = ctk.CTkLabel(window, text=text, font=ctk_font(12), text_color="#ffffff")
+        window.label.pack(pady=(20, 10), padx=20, anchor="w")
+        window.bar = ctk.CTkProgressBar(window)
+        window.bar.set(0)
+        window.bar.pack(fill="x", padx=20)
+        return window
+
+    def run_in_background(self, title, text, work, done):
+        """Run work(report) on a thread behind a progress window, then done(window, result)
+
+        work may call report(fraction, text) to move the progress bar. done
+        runs on the UI thread and is responsible for closing the window.
+        """
+        window = self.show_progress(title, text)
+        results = queue.Queue()
+
+        def run():
+            try:
+                result = work(lambda fraction, message: results.put(("progress", fraction, message)))
+            except Exception as error:
+                results.put(("failed", error))
+            else:
+                results.put(("done", result))
+
+        threading.Thread(target=run, daemon=True).start()
+        self.after(100, self.poll_background, window, results, done)
+
+    def poll_background(self, window, results, done):
+        """Show a background job's progress and hand over its result"""
+        while True:
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                window.bar.set(message[1])
+                window.label.configure(text=message[2])
+            elif message[0] == "failed":
+                window.destroy()
+                messagebox.showerror("Error", str(message[1]))
+                return
+            else:
+                done(window, message[1])
+                return
+        self.after(100, self.poll_background, window, results, done)
+
+    def import_csv(self, table):
+        """Import inventory items or suppliers from a CSV file"""
+        path = filedialog.askopenfilename(
+            parent=self, title="Import CSV", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+
+        def work(report):
+            return read_csv(path, table, lambda fraction, rows: report(fraction, f"{rows:,} rows read"))
+
+        self.run_in_background(
+            f"Importing {os.path.basename(path)}", "Reading file...", work,
+            lambda window, result: self.apply_import(table, result[0], result[1], window))
+
+    @timed("apply_import")
+    def apply_import(self, table, records, errors, window, start=0, added=None):
+        """Add validated records a chunk per event loop turn, then persist them as one batch"""
+        store = self.inventory_data if table == "inventory" else self.suppliers_data
+        added = [] if added is None else added
+        with self.storage.lock:
+            for record in records[start:start + IMPORT_CHUNK]:
+                if record["id"] in store:
+                    errors.append(f"ID {record['id']} already exists")
+                    continue
+                record = store.add(record)
+                if table == "inventory":
+                    self.index_item(record)
+                else:
+                    self.index_supplier(record)
+                added.append(record)
+
+        start += IMPORT_CHUNK
+        if start < len(records):
+            window.bar.set(start / len(records))
+            window.label.configure(text=f"Adding {start:,} of {len(records):,} records...")
+            self.after(1, self.apply_import, table, records, errors, window, start, added)
+            return
+
+        method = "put_item" if table == "inventory" else "put_supplier"
+        self.storage.write_batch([(method, record) for record in added])
+        window.destroy()
+
+        views = ("dashboard", "inventory") if table == "inventory" else ("suppliers",)
+        if self.current_section in views:
+            self.refresh_section(self.current_section)
+            self.section_versions[self.current_section] = self.section_version(self.current_section)
+
+        message = f"Imported {len(added):,} records."
+        if errors:
+            message += f"\n\nSkipped {len(errors):,} rows:\n" + "\n".join(errors[:10])
+            if len(errors) > 10:
+                message += "\n..."
+        messagebox.showinfo("Import Finished", message)
+
+    def export_csv(self, table):
+        """Export inventory items or suppliers to a CSV file"""
+        path = filedialog.asksaveasfilename(
+            parent=self, title="Export CSV", defaultextension=".csv", initialfile=f"{table}.csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        store = self.inventory_data if table == "inventory" else self.suppliers_data
+
+        def work(report):
+            # Copy under the lock so the file is a consistent snapshot, then
+            # write without it so edits are not held up by the disk
+            with self.storage.lock:
+                records = copy_records(store)
+            write_csv(path, table, records)
+            return len(records)
+
+        def done(window, count):
+            window.destroy()
+            messagebox.showinfo("Export Finished", f"Exported {count:,} records to {path}")
+
+        self.run_in_background(f"Exporting {table}", "Writing file...", work, done)
+
+    def show_reports(self, parent):
+        """Build the reports view into parent"""
         # Section label
         section_label = ctk.CTkLabel(
-            self.content_frame,
+            parent,
             text="Reports",
-            font=("Arial", 18, "bold"),
+            font=ctk_font(18, "bold"),
             text_color="#ffffff"
         )
         section_label.pack(anchor="w", pady=(0, 15))
 
         # Report selector frame
-        selector_frame = ctk.CTkFrame(self.content_frame, fg_color="#1a1a1a", corner_radius=10)
+        selector_frame = ctk.CTkFrame(parent, fg_color="#1a1a1a", corner_radius=10)
         selector_frame.pack(fill="x", pady=(0, 20))
 
         label = ctk.CTkLabel(
             selector_frame,
             text="Select Report Type:",
-            font=("Arial", 14),
+            font=ctk_font(14),
             text_color="#ffffff"
         )
         label.pack(side="left", padx=15, pady=15)
 
         self.report_menu = ctk.CTkOptionMenu(
             selector_frame,
-            values=["Inventory Status", "Low Stock Alert", "Out of Stock Items", "Total Inventory Value"],
-            font=("Arial", 12),
+            values=REPORT_TYPES,
+            font=ctk_font(12),
             command=self.generate_report
         )
         self.report_menu.pack(side="left", padx=10, pady=15)
         self.report_menu.set("Inventory Status")
 
         # Report output area
-        output_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        output_frame = ctk.CTkFrame(parent, fg_color="transparent")
         output_frame.pack(fill="both", expand=True)
 
         output_label = ctk.CTkLabel(
             output_frame,
             text="Report Output",
-            font=("Arial", 14, "bold"),
+            font=ctk_font(14, "bold"),
             text_color="#ffffff"
         )
         output_label.pack(anchor="w", pady=(0, 10))
@@ -576,7 +1067,7 @@ class InventoryDashboard(ctk.CTk):
         # Text area for report
         self.report_text = ctk.CTkTextbox(
             output_frame,
-            font=("Arial", 11),
+            font=ctk_font(11),
             fg_color="#1a1a1a",
             text_color="#ffffff",
             height=300
@@ -584,71 +1075,76 @@ class InventoryDashboard(ctk.CTk):
         self.report_text.pack(fill="both", expand=True)
         self.generate_report("Inventory Status")
 
+    @timed("generate_report")
     def generate_report(self, report_type):
-        """Generate different types of reports"""
+        """Generate different types of reports, filling the textbox in batches"""
+        self.cancel_report()
         self.report_text.delete("1.0", "end")
+        cached = self.report_cache.get(report_type, self.data_version)
+        if cached is not None:
+            self.report_batches = iter(cached)
+        else:
+            self.report_key = (report_type, self.data_version)
+            self.report_batches = batched_text(
+                iter_report(report_type, self.inventory_data, self.stats, self.status_index), REPORT_BATCH)
+        self.fill_report()
+
+    @timed("fill_report")
+    def fill_report(self):
+        """Append the next batch of report text and schedule the one after it"""
+        self.report_job = None
+        batch = next(self.report_batches, None)
+        if batch is None:
+            # Cache a report built from scratch unless the data changed meanwhile
+            if self.report_key is not None and self.report_key[1] == self.data_version:
+                self.report_cache.put(*self.report_key, self.report_shown)
+            self.cancel_report()
+            return
+        self.report_text.insert("end", batch)
+        if self.report_key is not None:
+            self.report_shown.append(batch)
+        # Keep formatting while the reader is within a few pages of the end;
+        # otherwise wait until they scroll down
+        if self.report_needs_text():
+            self.report_job = self.after(1, self.fill_report)
+        else:
+            self.report_job = self.after(100, self.wait_for_report_scroll)
 
-        if report_type == "Inventory Status":
-            report = "INVENTORY STATUS REPORT\n"
-            report += "=" * 50 + "\n\n"
-            for item in self.inventory_data:
-                report += f"ID: {item['id']} | {item['name']}\n"
-                report += f"Category: {item['category']} | Qty: {item['quantity']} | Price: ${item['price']:.2f}\n"
-                report += f"Status: {item['status']}\n\n"
-
-        elif report_type == "Low Stock Alert":
-            low_stock = [item for item in self.inventory_data if item['status'] == "Low Stock"]
-            report = "LOW STOCK ALERT\n"
-            report += "=" * 50 + "\n\n"
-            if low_stock:
-                for item in low_stock:
-                    report += f"⚠️  {item['name']} (ID: {item['id']})\n"
-                    report += f"Current Quantity: {item['quantity']}\n"
-                    report += f"Price: ${item['price']:.2f}\n\n"
-            else:
-                report += "No low stock items found!"
-
-        elif report_type == "Out of Stock Items":
-            out_of_stock = [item for item in self.inventory_data if item['status'] == "Out of Stock"]
-            report = "OUT OF STOCK ITEMS\n"
-            report += "=" * 50 + "\n\n"
-            if out_of_stock:
-                for item in out_of_stock:
-                    report += f"❌ {item['name']} (ID: {item['id']})\n"
-                    report += f"Price: ${item['price']:.2f}\n"
-                    report += f"Category: {item['category']}\n\n"
-            else:
-                report += "No out of stock items!"
-
-        elif report_type == "Total Inventory Value":
-            total_value = sum(item['quantity'] * item['price'] for item in self.inventory_data)
-            report = "TOTAL INVENTORY VALUE REPORT\n"
-            report += "=" * 50 + "\n\n"
-            report += f"Total Products: {len(self.inventory_data)}\n"
-            report += f"Total Units: {sum(item['quantity'] for item in self.inventory_data)}\n"
-            report += f"Total Inventory Value: ${total_value:,.2f}\n\n"
-            report += "BREAKDOWN BY CATEGORY:\n"
-            categories = {}
-            for item in self.inventory_data:
-                cat = item['category']
-                if cat not in categories:
-                    categories[cat] = 0
-                categories[cat] += item['quantity'] * item['price']
-            for cat, value in categories.items():
-                report += f"{cat}: ${value:,.2f}\n"
-
-        self.report_text.insert("1.0", report)
-
-    def show_suppliers(self):
-        """Display suppliers view"""
+    def wait_for_report_scroll(self):
+        """Resume filling the report once it is scrolled towards the end"""
+        self.report_job = None
+        if self.report_needs_text():
+            self.fill_report()
+        else:
+            self.report_job = self.after(100, self.wait_for_report_scroll)
+
+    def report_needs_text(self):
+        """Whether fewer than REPORT_PAGES_AHEAD screens of text are left below the view"""
+        text = self.report_text
+        first = int(text.index("@0,0").split(".")[0])
+        last = int(text.index(f"@0,{text.winfo_height()}").split(".")[0])
+        end = int(text.index("end-1c").split(".")[0])
+        return end - last < REPORT_PAGES_AHEAD * (last - first + 1)
+
+    def cancel_report(self):
+        """Stop filling a report that is no longer shown"""
+        if self.report_job is not None:
+            self.after_cancel(self.report_job)
+            self.report_job = None
+        self.report_batches = None
+        self.report_key = None
+        self.report_shown = []
+
+    def show_suppliers(self, parent):
+        """Build the suppliers view into parent and return its table"""
         # Top controls frame
-        controls_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        controls_frame = ctk.CTkFrame(parent, fg_color="transparent")
         controls_frame.pack(fill="x", pady=(0, 15))
 
         section_label = ctk.CTkLabel(
             controls_frame,
             text="Supplier Management",
-            font=("Arial", 18, "bold"),
+            font=ctk_font(18, "bold"),
             text_color="#ffffff"
         )
         section_label.pack(side="left", anchor="w")
@@ -657,17 +1153,39 @@ class InventoryDashboard(ctk.CTk):
         add_btn = ctk.CTkButton(
             controls_frame,
             text="➕ Add Supplier",
-            font=("Arial", 12),
+            font=ctk_font(12),
             fg_color="#00a8ff",
             hover_color="#0088cc",
             command=self.add_supplier_dialog
         )
         add_btn.pack(side="right", padx=5)
 
+        # CSV import/export buttons
+        export_btn = ctk.CTkButton(
+            controls_frame,
+            text="⬇ Export CSV",
+            font=ctk_font(12),
+            fg_color="#2d2d2d",
+            hover_color="#3d3d3d",
+            command=lambda: self.export_csv("suppliers")
+        )
+        export_btn.pack(side="right", padx=5)
+
+        import_btn = ctk.CTkButton(
+            controls_frame,
+            text="⬆ Import CSV",
+            font=ctk_font(12),
+            fg_color="#2d2d2d",
+            hover_color="#3d3d3d",
+            command=lambda: self.import_csv("suppliers")
+        )
+        import_btn.pack(side="right", padx=5)
+
         # Suppliers table with edit/delete
-        self.create_inventory_table(self.content_frame, self.suppliers_data,
-                                    ["Supplier ID", "Name", "Contact", "Email", "Status"],
-                                    show_status=False, editable=True)
+        return self.create_inventory_table(
+            parent, self.suppliers_data,
+            ["Supplier ID", "Name", "Contact", "Email", "Status"],
+            show_status=False, editable=True, section="suppliers")
 
     def add_supplier_dialog(self):
         """Show dialog to add new supplier"""
@@ -684,15 +1202,15 @@ class InventoryDashboard(ctk.CTk):
         }
 
         for i, (field, var) in enumerate(fields.items()):
-            label = ctk.CTkLabel(dialog, text=field, font=("Arial", 12), text_color="#ffffff")
+            label = ctk.CTkLabel(dialog, text=field, font=ctk_font(12), text_color="#ffffff")
             label.pack(pady=(15 if i == 0 else 10, 5), padx=20, anchor="w")
 
             entry = ctk.CTkEntry(dialog, textvariable=var, placeholder_text=f"Enter {field.lower()}",
-                                font=("Arial", 11))
+                                font=ctk_font(11))
             entry.pack(fill="x", padx=20, pady=5)
 
         # Status
-        label = ctk.CTkLabel(dialog, text="Status", font=("Arial", 12), text_color="#ffffff")
+        label = ctk.CTkLabel(dialog, text="Status", font=ctk_font(12), text_color="#ffffff")
         label.pack(pady=10, padx=20, anchor="w")
 
         status_var = ctk.StringVar(value="Active")
@@ -700,28 +1218,35 @@ class InventoryDashboard(ctk.CTk):
             dialog,
             values=["Active", "Inactive"],
             variable=status_var,
-            font=("Arial", 11)
+            font=ctk_font(11)
         )
         status_menu.pack(fill="x", padx=20, pady=5)
 
+        @timed("add_supplier_dialog.submit")
         def submit():
-            new_supplier = {
-                "id": fields["ID"].get(),
-                "name": fields["Name"].get(),
-                "contact": fields["Contact"].get(),
-                "email": fields["Email"].get(),
-                "status": status_var.get()
-            }
+            new_supplier = Supplier(
+                id=fields["ID"].get(),
+                name=fields["Name"].get(),
+                contact=fields["Contact"].get(),
+                email=fields["Email"].get(),
+                status=status_var.get()
+            )
 
             if not new_supplier["id"] or not new_supplier["name"]:
                 messagebox.showerror("Error", "ID and Name are required!")
                 return
 
-            self.suppliers_data.append(new_supplier)
-            self.save_data()
+            if new_supplier["id"] in self.suppliers_data:
+                messagebox.showerror("Error", f"A supplier with ID {new_supplier['id']} already exists!")
+                return
+
+            with self.storage.lock:
+                self.suppliers_data.add(new_supplier)
+            self.index_supplier(new_supplier)
+            self.storage.put_supplier(new_supplier)
             messagebox.showinfo("Success", "Supplier added successfully!")
             dialog.destroy()
-            self.show_section("suppliers")
+            self.patch_section("suppliers", "insert", new_supplier)
 
         submit_btn = ctk.CTkButton(
             dialog,
@@ -729,7 +1254,7 @@ class InventoryDashboard(ctk.CTk):
             command=submit,
             fg_color="#00a8ff",
             hover_color="#0088cc",
-            font=("Arial", 12)
+            font=ctk_font(12)
         )
         submit_btn.pack(pady=20, padx=20, fill="x")
 
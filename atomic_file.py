@@ -0,0 +1,29 @@
+import contextlib
+import os
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode='w', permissions=None, **kwargs):
+    """Open a temporary file next to path and move it over path when the block ends
+
+    A crash or an exception part way through leaves path as it was. With
+    permissions the temporary file is created with that mode rather than
+    the umask default; the other keyword arguments go to open().
+    """
+    temp_path = path + ".tmp"
+    try:
+        if permissions is None:
+            f = open(temp_path, mode, **kwargs)
+        else:
+            # A leftover temporary file would keep its old mode, so start afresh
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, permissions)
+            f = os.fdopen(fd, mode, **kwargs)
+        with f:
+            yield f
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
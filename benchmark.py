@@ -0,0 +1,221 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from dashboard_data import DashboardData
+from item_store import stock_status
+from reports import REPORT_TYPES, iter_report
+from snapshot import write_snapshot
+from storage import AsyncWriter, JsonStorage, SnapshotStorage
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+CATEGORIES = ["Electronics", "Accessories", "Hardware"]
+# Keys of admin_dashboard.TABLE_ENGINES, listed here so --help and the data
+# benchmarks never import customtkinter
+TABLE_ENGINES = ["tree", "virtual"]
+
+WORDS = ["Cordless", "Steel", "Mini", "Pro", "Heavy Duty", "Compact", "Digital", "Magnetic",
+         "Drill", "Hammer", "Wrench", "Cable", "Adapter", "Socket", "Clamp", "Router", "Sander"]
+
+
+class HeadlessDashboard(DashboardData):
+    """The dashboard's data methods, run without creating its window"""
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.data_version = 0
+        self.suppliers_version = 0
+
+
+def generate_catalog(rows, seed=0):
+    """Inventory and supplier dicts in the JSON schema, the same for the same seed"""
+    rng = random.Random(seed)
+    inventory = []
+    for i in range(rows):
+        quantity = rng.choice((0, rng.randint(1, 10), rng.randint(11, 500), rng.randint(11, 500)))
+        inventory.append({
+            "id": f"P{i:07d}",
+            "name": " ".join(rng.sample(WORDS, 3)),
+            "category": rng.choice(CATEGORIES),
+            "quantity": quantity,
+            "price": round(rng.uniform(0.5, 2500), 2),
+            "status": stock_status(quantity)
+        })
+    suppliers = []
+    for i in range(max(1, rows // 100)):
+        suppliers.append({
+            "id": f"S{i:05d}",
+            "name": f"{rng.choice(WORDS)} Supply {i}",
+            "contact": f"+1 555 {rng.randint(0, 9999):04d}",
+            "email": f"orders{i}@supplier.example",
+            "status": rng.choice(("Active", "Active", "Inactive"))
+        })
+    return inventory, suppliers
+
+
+def measure(fn, repeat):
+    """Best wall time over repeat runs, then the peak traced memory of one more run"""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def first_search(app, query):
+    """A search on freshly loaded data, building the search index first"""
+    app.search_index = None
+    return app.search(query)
+
+
+def bench_size(rows, seed, repeat, workdir):
+    """Results for the headless benchmarks at one catalog size"""
+    inventory, suppliers = generate_catalog(rows, seed)
+    path = os.path.join(workdir, f"inventory_{rows}.json")
+    with open(path, 'w') as f:
+        json.dump({"inventory": inventory, "suppliers": suppliers}, f, indent=2)
+    snapshot_path = os.path.join(workdir, f"inventory_{rows}.snapshot")
+    write_snapshot(snapshot_path, inventory, suppliers)
+    del inventory, suppliers
+
+    app = HeadlessDashboard(JsonStorage(path))
+    snapshot_app = HeadlessDashboard(SnapshotStorage(snapshot_path))
+    cases = [
+        ("load_data", app.load_data),
+        ("load_data:snapshot", snapshot_app.load_data),
+        ("save_data", app.save_data),
+        ("update_status", lambda: [app.update_status(item) for item in app.inventory_data]),
+        ("stats_values", app.stats_values),
+        ("status_rows:snapshot", lambda: snapshot_app.status_index.items("Low Stock")),
+        ("first_search", lambda: first_search(app, "drill")),
+        ("first_search:snapshot", lambda: first_search(snapshot_app, "drill")),
+    ]
+    # generate_report's work without the textbox it is written into
+    for report_type in REPORT_TYPES:
+        cases.append((f"report:{report_type}", lambda report_type=report_type: "".join(
+            iter_report(report_type, app.inventory_data, app.stats, app.status_index))))
+
+    app.load_data()
+    results = []
+    for name, fn in cases:
+        seconds, peak = measure(fn, repeat)
+        results.append({"name": name, "rows": rows, "seconds": seconds, "peak_bytes": peak})
+        print(f"{rows:>9,} {name:<32} {seconds * 1000:10.1f} ms {peak / 1e6:10.1f} MB", file=sys.stderr)
+    # Each load unmapped the one before; unmap the last before workdir is removed
+    snapshot_app.storage.close()
+    return results
+
+
+def bench_table(rows, workdir, engine):
+    """Time building the inventory section's table in a real window (needs a display, e.g. Xvfb)
+
+    The tree engine counts until its last batch of rows is inserted.
+    """
+    # Imported here so the data benchmarks run without Tk or a display
+    from admin_dashboard import InventoryDashboard
+
+    path = os.path.join(workdir, f"inventory_{rows}.json")
+    app = InventoryDashboard(AsyncWriter(JsonStorage(path)), table_engine=engine)
+    while app.loading:
+        app.update()
+        time.sleep(0.01)
+    app.update()
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    app.show_section("inventory")
+    app.update()
+    while getattr(app.current_table, "insert_job", None) is not None:
+        app.update()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    app.on_close()
+    name = "create_inventory_table" if engine == "virtual" else f"create_inventory_table:{engine}"
+    print(f"{rows:>9,} {name:<32} {seconds * 1000:10.1f} ms {peak / 1e6:10.1f} MB", file=sys.stderr)
+    return {"name": name, "rows": rows, "seconds": seconds, "peak_bytes": peak}
+
+
+def find_regressions(results, baseline, tolerance, min_seconds=0.001):
+    """Messages for results slower than the baseline by more than tolerance
+
+    Differences under min_seconds are timer noise and never count.
+    """
+    previous = {(result["name"], result["rows"]): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["name"], result["rows"]))
+        if (old is not None and result["seconds"] > old["seconds"] * (1 + tolerance)
+                and result["seconds"] - old["seconds"] > min_seconds):
+            regressions.append(f"{result['name']} at {result['rows']:,} rows: "
+                               f"{old['seconds'] * 1000:.1f} ms -> {result['seconds'] * 1000:.1f} ms")
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmarks and write the results as JSON"""
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's data paths on synthetic catalogs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="catalog sizes in rows")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the catalog generator")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark, the best counts")
+    parser.add_argument("--gui", action="store_true",
+                        help="also time building the inventory table; run under xvfb-run without a display")
+    parser.add_argument("--engines", nargs="+", choices=TABLE_ENGINES, default=TABLE_ENGINES,
+                        help="table engines to time with --gui")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file instead of stdout")
+    parser.add_argument("--baseline", help="results of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown against the baseline before failing (default: 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.sizes:
+            results.extend(bench_size(rows, args.seed, args.repeat, workdir))
+            if args.gui:
+                for engine in args.engines:
+                    results.append(bench_table(rows, workdir, engine))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
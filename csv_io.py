@@ -0,0 +1,87 @@
+import csv
+import os
+
+from atomic_file import atomic_write
+from item_store import ITEM_FIELDS, SUPPLIER_FIELDS, InventoryItem, Supplier, stock_status
+
+# Columns written on export and read on import, per table
+CSV_FIELDS = {"inventory": ITEM_FIELDS, "suppliers": SUPPLIER_FIELDS}
+
+
+def parse_item(row):
+    """Validate one CSV row like the Add Product dialog and build an item"""
+    try:
+        quantity = int(row.get("quantity") or "")
+        price = float(row.get("price") or "")
+    except ValueError:
+        raise ValueError("Quantity must be a number and Price must be a decimal!")
+    item = InventoryItem(
+        id=row.get("id") or "",
+        name=row.get("name") or "",
+        category=row.get("category") or "",
+        quantity=quantity,
+        price=price,
+        status=stock_status(quantity)
+    )
+    if not item["id"] or not item["name"]:
+        raise ValueError("ID and Product Name are required!")
+    return item
+
+
+def parse_supplier(row):
+    """Validate one CSV row like the Add Supplier dialog and build a supplier"""
+    supplier = Supplier(
+        id=row.get("id") or "",
+        name=row.get("name") or "",
+        contact=row.get("contact") or "",
+        email=row.get("email") or "",
+        status=row.get("status") or "Active"
+    )
+    if not supplier["id"] or not supplier["name"]:
+        raise ValueError("ID and Name are required!")
+    return supplier
+
+
+PARSERS = {"inventory": parse_item, "suppliers": parse_supplier}
+
+
+def read_csv(path, table, progress=None, progress_rows=2000):
+    """Read and validate a CSV file of records row by row
+
+    Returns (records, errors), where errors are "Line N: message" strings
+    for the rows that were skipped. Rows repeating an id seen earlier in the
+    file are skipped too. progress(fraction, rows) is called every
+    progress_rows rows with the share of the file read so far.
+    """
+    parse = PARSERS[table]
+    records = []
+    errors = []
+    seen = set()
+    size = os.path.getsize(path) or 1
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is not None:
+            reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        for row in reader:
+            try:
+                record = parse(row)
+                if record["id"] in seen:
+                    raise ValueError(f"ID {record['id']} appears more than once in the file")
+            except ValueError as error:
+                errors.append(f"Line {reader.line_num}: {error}")
+            else:
+                seen.add(record["id"])
+                records.append(record)
+            if progress is not None and reader.line_num % progress_rows == 0:
+                # The byte offset of the underlying file runs a buffer ahead of the reader
+                progress(min(1.0, f.buffer.tell() / size), reader.line_num)
+    return records, errors
+
+
+def write_csv(path, table, records):
+    """Write records to a CSV file with one column per field"""
+    fields = CSV_FIELDS[table]
+    with atomic_write(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows([record.get(field) for field in fields] for record in records)
@@ -0,0 +1,136 @@
+from search_index import SearchIndex
+from inventory_index import (ColumnIndex, ColumnStats, FieldIndex, InventoryStats, SnapshotStats,
+                             SortIndex)
+from item_store import ColumnarStore, stock_status
+from snapshot import SnapshotStore
+from perf import timed
+
+
+class DashboardData:
+    """The dashboard's data and index upkeep, free of Tk so it runs without a window
+
+    InventoryDashboard mixes this in; the benchmark uses it on its own. The
+    class expects storage, data_version and suppliers_version attributes.
+    """
+
+    @timed("load_data")
+    def load_data(self, preloaded=None):
+        """Load data from storage unless already read
+
+        A read error propagates before the storage is attached, so a later
+        save can never replace the stored data with an empty catalog.
+        """
+        if preloaded is not None:
+            self.inventory_data, self.suppliers_data = preloaded
+        else:
+            self.inventory_data, self.suppliers_data = self.storage.load()
+        self.storage.attach(self.inventory_data, self.suppliers_data)
+
+        # Maintained aggregates and the search index, built here on the loader
+        # thread so neither the first stats card nor the first keystroke waits;
+        # a snapshot keeps its cold start instead and indexes on the first search
+        if isinstance(self.inventory_data, ColumnarStore):
+            # Totals and status lookups are passes over the columns
+            self.stats = ColumnStats(self.inventory_data)
+            self.status_index = ColumnIndex("status", self.inventory_data)
+            self.category_index = ColumnIndex("category", self.inventory_data)
+        elif isinstance(self.inventory_data, SnapshotStore):
+            # Totals come from the snapshot's metadata and status and category
+            # lookups read its slot groups
+            self.stats = SnapshotStats(self.inventory_data)
+            self.status_index = ColumnIndex("status", self.inventory_data)
+            self.category_index = ColumnIndex("category", self.inventory_data)
+        else:
+            self.stats = InventoryStats(self.inventory_data)
+            self.status_index = FieldIndex("status", self.inventory_data)
+            self.category_index = FieldIndex("category", self.inventory_data)
+        self.search_index = None
+        if not isinstance(self.inventory_data, SnapshotStore):
+            self.search_index = SearchIndex(self.inventory_data)
+        # Sort orders per collection and field, built on the first header click
+        self.sort_indexes = {"inventory": {}, "suppliers": {}}
+        self.data_version += 1
+
+    @timed("save_data")
+    def save_data(self):
+        """Save all data to storage"""
+        self.data_version += 1
+        self.storage.save_all()
+
+    def update_status(self, item):
+        """Auto-update status based on quantity"""
+        item["status"] = stock_status(item["quantity"])
+
+    def index_item(self, item):
+        """Add a new inventory item to the lookup indexes"""
+        self.data_version += 1
+        self.stats.add(item)
+        self.status_index.add(item)
+        self.category_index.add(item)
+        if self.search_index is not None:
+            self.search_index.add(item)
+        for index in self.sort_indexes["inventory"].values():
+            index.add(item)
+
+    def reindex_item(self, item):
+        """Refresh the lookup indexes after an inventory item was edited"""
+        self.data_version += 1
+        self.stats.update(item)
+        self.status_index.update(item)
+        self.category_index.update(item)
+        if self.search_index is not None:
+            self.search_index.update(item)
+        for index in self.sort_indexes["inventory"].values():
+            index.update(item)
+
+    def index_supplier(self, supplier):
+        """Add a new supplier to the sort orders"""
+        self.suppliers_version += 1
+        for index in self.sort_indexes["suppliers"].values():
+            index.add(supplier)
+
+    def reindex_supplier(self, supplier):
+        """Refresh the sort orders after a supplier was edited"""
+        self.suppliers_version += 1
+        for index in self.sort_indexes["suppliers"].values():
+            index.update(supplier)
+
+    def unindex_supplier(self, supplier):
+        """Remove a deleted supplier from the sort orders"""
+        self.suppliers_version += 1
+        for index in self.sort_indexes["suppliers"].values():
+            index.remove(supplier)
+
+    def unindex_item(self, item):
+        """Remove a deleted inventory item from the lookup indexes"""
+        self.data_version += 1
+        self.stats.remove(item)
+        self.status_index.remove(item)
+        self.category_index.remove(item)
+        if self.search_index is not None:
+            self.search_index.remove(item)
+        for index in self.sort_indexes["inventory"].values():
+            index.remove(item)
+
+    def stats_values(self):
+        """Label, value and color of each statistics card"""
+        return [
+            ("Total Products", str(self.stats.count), "#00a8ff"),
+            ("In Stock", str(self.stats.status_count('In Stock')), "#00cc88"),
+            ("Low Stock", str(self.stats.status_count('Low Stock')), "#ffaa00"),
+            ("Out of Stock", str(self.stats.status_count('Out of Stock')), "#ff5555"),
+        ]
+
+    def sort_index(self, collection, field):
+        """Sort order of the inventory or suppliers by a field, built on first use"""
+        index = self.sort_indexes[collection].get(field)
+        if index is None:
+            data = self.suppliers_data if collection == "suppliers" else self.inventory_data
+            index = self.sort_indexes[collection][field] = SortIndex(field, data)
+        return index
+
+    def search(self, query):
+        """Inventory items matching a search query, indexing them on first use"""
+        if self.search_index is None:
+            self.search_index = SearchIndex(self.inventory_data)
+        return self.search_index.search(query)
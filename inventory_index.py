@@ -0,0 +1,358 @@
+from bisect import bisect_left, bisect_right
+
+
+class InventoryStats:
+    """Running totals over the inventory, kept current one item at a time
+
+    Each structure in this module follows the same protocol: add() a new
+    item, update() an item after it was edited and remove() a deleted one.
+    The values an item was counted with are remembered, so update() and
+    remove() work without knowing what the item looked like before.
+    """
+
+    def __init__(self, items=()):
+        self.count = 0
+        self.status_counts = {}
+        self.total_units = 0
+        self.total_value = 0.0
+        self.category_counts = {}
+        self.category_units = {}
+        self.category_values = {}
+        # Counted (status, quantity, price, category) per item, keyed by object identity
+        self.entries = {}
+        for item in items:
+            self.add(item)
+
+    def apply(self, entry, sign):
+        """Add (sign 1) or subtract (sign -1) one item's contribution"""
+        status, quantity, price, category = entry
+        self.count += sign
+        self.status_counts[status] = self.status_counts.get(status, 0) + sign
+        self.total_units += sign * quantity
+        self.total_value += sign * quantity * price
+        self.category_counts[category] = self.category_counts.get(category, 0) + sign
+        self.category_units[category] = self.category_units.get(category, 0) + sign * quantity
+        self.category_values[category] = self.category_values.get(category, 0) + sign * quantity * price
+        if not self.category_counts[category]:
+            del self.category_counts[category]
+            del self.category_units[category]
+            del self.category_values[category]
+
+    def add(self, item):
+        """Count a new item"""
+        entry = (item["status"], item["quantity"], item["price"], item["category"])
+        self.entries[id(item)] = entry
+        self.apply(entry, 1)
+
+    def update(self, item):
+        """Recount an edited item"""
+        self.remove(item)
+        self.add(item)
+
+    def remove(self, item):
+        """Stop counting an item"""
+        entry = self.entries.pop(id(item), None)
+        if entry is not None:
+            self.apply(entry, -1)
+
+    def status_count(self, status):
+        """Number of items with the given status"""
+        return self.status_counts.get(status, 0)
+
+
+class FieldIndex:
+    """Secondary index from one field's value to the items holding it
+
+    Buckets keep catalog order, so listing the items with a given value
+    costs O(matching items) rather than a scan of the whole inventory.
+    """
+
+    def __init__(self, field, items=()):
+        self.field = field
+        self.buckets = {}
+        self.unsorted = set()
+        # Indexed value and catalog position per item, keyed by object identity
+        self.values = {}
+        self.order = {}
+        self.counter = 0
+        for item in items:
+            self.add(item)
+
+    def insert(self, item, value):
+        """Put an item into the bucket for value"""
+        bucket = self.buckets.setdefault(value, {})
+        if bucket and self.order[id(item)] < self.order[next(reversed(bucket))]:
+            self.unsorted.add(value)
+        bucket[id(item)] = item
+        self.values[id(item)] = value
+
+    def add(self, item):
+        """Index a new item at the end of the catalog order"""
+        self.order[id(item)] = self.counter
+        self.counter += 1
+        self.insert(item, item[self.field])
+
+    def update(self, item):
+        """Move an edited item to the bucket for its current value"""
+        if id(item) not in self.values:
+            self.add(item)
+            return
+        old_value = self.values[id(item)]
+        if old_value != item[self.field]:
+            self.discard(item, old_value)
+            self.insert(item, item[self.field])
+
+    def remove(self, item):
+        """Drop a deleted item"""
+        if id(item) in self.values:
+            self.discard(item, self.values[id(item)])
+            del self.order[id(item)]
+
+    def discard(self, item, value):
+        """Take an item out of the bucket for value"""
+        bucket = self.buckets[value]
+        del bucket[id(item)]
+        del self.values[id(item)]
+        if not bucket:
+            del self.buckets[value]
+            self.unsorted.discard(value)
+
+    def items(self, value):
+        """Items with the given value, in catalog order"""
+        bucket = self.buckets.get(value)
+        if not bucket:
+            return []
+        if value in self.unsorted:
+            keys = sorted(bucket, key=self.order.__getitem__)
+            self.buckets[value] = bucket = {key: bucket[key] for key in keys}
+            self.unsorted.discard(value)
+        return list(bucket.values())
+
+    def count(self, value):
+        """Number of items with the given value"""
+        return len(self.buckets.get(value, ()))
+
+
+class ReversedView:
+    """Read-only reversed view of a list, for descending order without a copy"""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[len(self.items) - 1 - index]
+
+    def __iter__(self):
+        return reversed(self.items)
+
+
+class SortIndex:
+    """Items in the order of one field, kept sorted one item at a time
+
+    Sorting happens once, when the index is built; after that add(),
+    update() and remove() place or take out a single item with a binary
+    search. Keys are (value, catalog position) with strings compared
+    case-insensitively, so ties keep catalog order and every key is unique.
+    """
+
+    def __init__(self, field, items=()):
+        self.field = field
+        self.counter = 0
+        # Sort key per item, keyed by object identity
+        self.item_keys = {}
+        entries = [(self.new_key(item), item) for item in items]
+        entries.sort(key=lambda entry: entry[0])
+        # Sorted keys and the items in the same order; both lists are only
+        # ever changed in place, so views handed out stay current
+        self.keys = [key for key, item in entries]
+        self.items = [item for key, item in entries]
+        self.descending = ReversedView(self.items)
+
+    def value(self, item):
+        """The sort value of an item's field"""
+        value = item[self.field]
+        return value.casefold() if isinstance(value, str) else value
+
+    def new_key(self, item, position=None):
+        """Key of an item, at the end of the catalog order unless a position is given"""
+        if position is None:
+            position = self.counter
+            self.counter += 1
+        key = self.item_keys[id(item)] = (self.value(item), position)
+        return key
+
+    def key(self, item):
+        """Sort key of an indexed item, for sorting a subset such as search results"""
+        return self.item_keys[id(item)]
+
+    def insert(self, item, key):
+        """Put an item at its key's place"""
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.items.insert(index, item)
+
+    def discard(self, key):
+        """Take out the item with a key"""
+        index = bisect_left(self.keys, key)
+        del self.keys[index]
+        del self.items[index]
+
+    def add(self, item):
+        """Index a new item"""
+        self.insert(item, self.new_key(item))
+
+    def update(self, item):
+        """Move an edited item if its sort value changed"""
+        old_key = self.item_keys.get(id(item))
+        if old_key is None:
+            self.add(item)
+        elif old_key[0] != self.value(item):
+            self.discard(old_key)
+            self.insert(item, self.new_key(item, old_key[1]))
+
+    def remove(self, item):
+        """Drop a deleted item"""
+        key = self.item_keys.pop(id(item), None)
+        if key is not None:
+            self.discard(key)
+
+    def position(self, item, descending=False):
+        """Row of an indexed item in ascending or descending order"""
+        index = bisect_left(self.keys, self.item_keys[id(item)])
+        return len(self.keys) - 1 - index if descending else index
+
+    def view(self, descending=False):
+        """The sorted items, live as the index changes"""
+        return self.descending if descending else self.items
+
+
+class ColumnStats:
+    """InventoryStats counterpart computed from a ColumnarStore's columns
+
+    The columns are the source of truth, so the maintenance hooks do nothing
+    and every total is a C-level pass over the typed arrays.
+    """
+
+    def __init__(self, store):
+        self.store = store
+
+    def add(self, item):
+        pass
+
+    def update(self, item):
+        pass
+
+    def remove(self, item):
+        pass
+
+    @property
+    def count(self):
+        return len(self.store)
+
+    @property
+    def total_units(self):
+        return self.store.total_units()
+
+    @property
+    def total_value(self):
+        return self.store.total_value()
+
+    @property
+    def category_values(self):
+        return self.store.category_values()
+
+    def status_count(self, status):
+        """Number of items with the given status"""
+        return self.store.count_value("status", status)
+
+
+class SnapshotStats(InventoryStats):
+    """InventoryStats over a SnapshotStore, started from the totals stored in its file
+
+    Items count with their snapshot values until they are first updated
+    or removed; only then is an entry of their own remembered, so opening
+    the snapshot builds no items. Files written before the totals were
+    stored are summed in one pass over their packed records instead.
+    """
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        # Slots whose snapshot values no longer count
+        self.detached = set()
+        snapshot = store.snapshot
+        if snapshot.category_counts is not None:
+            status_counts = snapshot.status_counts
+            category_counts = snapshot.category_counts
+            category_units = snapshot.category_units
+            category_values = snapshot.category_values
+        else:
+            # Totals per status and category code, turned into the usual dicts after the pass
+            status_counts = [0] * len(snapshot.statuses)
+            category_counts = [0] * len(snapshot.categories)
+            category_units = [0] * len(snapshot.categories)
+            category_values = [0.0] * len(snapshot.categories)
+            for _, _, _, _, quantity, price, category, status in snapshot.iter_records():
+                status_counts[status] += 1
+                category_counts[category] += 1
+                category_units[category] += quantity
+                category_values[category] += quantity * price
+        self.count = len(snapshot)
+        self.total_units = sum(category_units)
+        self.total_value = sum(category_values)
+        self.status_counts = {status: count for status, count in zip(snapshot.statuses, status_counts) if count}
+        for category, count, units, value in zip(snapshot.categories, category_counts, category_units,
+                                                 category_values):
+            if count:
+                self.category_counts[category] = count
+                self.category_units[category] = units
+                self.category_values[category] = value
+        # Rows the storage already changed while loading, e.g. from its journal
+        for slot in store.deleted:
+            self.detached.add(slot)
+            self.apply(snapshot.entry(slot), -1)
+        for slot, item in store.items.items():
+            self.detached.add(slot)
+            self.apply(snapshot.entry(slot), -1)
+            self.add(item)
+        for item in store.added:
+            self.add(item)
+
+    def remove(self, item):
+        """Stop counting an item"""
+        entry = self.entries.pop(id(item), None)
+        if entry is None:
+            slot = self.store.slots.get(id(item))
+            if slot is None or slot in self.detached:
+                return
+            self.detached.add(slot)
+            entry = self.store.snapshot.entry(slot)
+        self.apply(entry, -1)
+
+
+class ColumnIndex:
+    """FieldIndex counterpart that scans a ColumnarStore's code column"""
+
+    def __init__(self, field, store):
+        self.field = field
+        self.store = store
+
+    def add(self, item):
+        pass
+
+    def update(self, item):
+        pass
+
+    def remove(self, item):
+        pass
+
+    def items(self, value):
+        """Items with the given value, in catalog order"""
+        return self.store.rows_with(self.field, value)
+
+    def count(self, value):
+        """Number of items with the given value"""
+        return self.store.count_value(self.field, value)
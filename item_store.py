@@ -0,0 +1,434 @@
+import operator
+from array import array
+from itertools import accumulate, compress
+
+ITEM_FIELDS = ("id", "name", "category", "quantity", "price", "status")
+SUPPLIER_FIELDS = ("id", "name", "contact", "email", "status")
+
+
+def stock_status(quantity):
+    """Inventory status for a quantity on hand"""
+    if quantity == 0:
+        return "Out of Stock"
+    if quantity <= 10:
+        return "Low Stock"
+    return "In Stock"
+
+
+class Record:
+    """Slotted record that reads and writes like the original item dicts"""
+
+    __slots__ = ()
+    fields = ()
+
+    # record["name"] and record["name"] = ... go straight to the slots
+    __getitem__ = object.__getattribute__
+    __setitem__ = object.__setattr__
+
+    def __init__(self, **values):
+        for field in self.fields:
+            setattr(self, field, values.get(field))
+
+    def __contains__(self, field):
+        return field in self.fields
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def get(self, field, default=None):
+        """Field value, or default for a field the record does not have"""
+        return getattr(self, field, default)
+
+    def keys(self):
+        """Field names, in the order of the JSON schema"""
+        return self.fields
+
+    def to_dict(self):
+        """Plain dict in the JSON schema"""
+        return {field: getattr(self, field) for field in self.fields}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a dict in the JSON schema"""
+        return cls(**{field: data.get(field) for field in cls.fields})
+
+
+class InventoryItem(Record):
+    """One product in the inventory"""
+
+    __slots__ = fields = ITEM_FIELDS
+
+
+class Supplier(Record):
+    """One supplier"""
+
+    __slots__ = fields = SUPPLIER_FIELDS
+
+
+class ItemStore:
+    """Ordered collection of records keyed by their id
+
+    Lookup, membership, insertion and removal by id are O(1). Iteration and
+    positional access follow insertion order; a removal takes its record out
+    of the position list in place, one scan of the list.
+    """
+
+    def __init__(self, records=()):
+        self.by_id = {}
+        self.rows = []
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def from_dicts(cls, record_class, dicts):
+        """Load JSON-schema dicts, keeping rows that share an id"""
+        store = cls()
+        for data in dicts:
+            store.add_loaded(record_class.from_dict(data))
+        return store
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def __contains__(self, record_id):
+        return record_id in self.by_id
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def get(self, record_id, default=None):
+        """Record with the given id"""
+        return self.by_id.get(record_id, default)
+
+    def search_fields(self):
+        """(handle, id, name, category) of every record in catalog order, for SearchIndex"""
+        return ((record, record.id, record.name, record.category) for record in self.by_id.values())
+
+    def search_handle(self, record):
+        """What SearchIndex keeps for a record: the record itself"""
+        return record
+
+    def search_item(self, handle):
+        """The record of a SearchIndex handle"""
+        return handle
+
+    def add(self, record):
+        """Append a record and return it; its id must not be in the store yet"""
+        if record.id in self.by_id:
+            raise KeyError(f"Duplicate id {record.id!r}")
+        self.by_id[record.id] = record
+        self.rows.append(record)
+        return record
+
+    def add_loaded(self, record):
+        """Append a record read from storage, renaming a clashing id in place
+
+        Older data files could hold the same id twice; both rows are kept.
+        """
+        base, n = record.id, 2
+        while record.id in self.by_id:
+            record.id = f"{base} ({n})"
+            n += 1
+        self.add(record)
+
+    def remove(self, record):
+        """Remove a record"""
+        del self.by_id[record.id]
+        self.rows.remove(record)
+
+
+class CodeTable:
+    """Interns repeated strings as small integer codes; code 0 marks a deleted row"""
+
+    def __init__(self):
+        self.values = [None]
+        self.codes = {}
+
+    def code(self, value):
+        """Code for a value, assigning a new one the first time"""
+        code = self.codes.get(value)
+        if code is None:
+            if len(self.values) > 65535:
+                raise ValueError("A columnar store holds at most 65535 distinct categories and statuses")
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def mask(self, codes, value):
+        """Flags for compress, true where codes equals value's code"""
+        code = self.codes[value]
+        if codes.typecode == 'B':
+            table = bytearray(256)
+            table[code] = 1
+            return codes.tobytes().translate(table)
+        return map(code.__eq__, codes)
+
+
+def column_property(field):
+    """Property reading and writing one column of a ColumnarRow"""
+    return property(lambda row: row.store.read(row.slot, field),
+                    lambda row, value: row.store.write(row.slot, field, value))
+
+
+class ColumnarRow(Record):
+    """View of one row of a ColumnarStore, read and written like an InventoryItem"""
+
+    __slots__ = ("store", "slot")
+    fields = ITEM_FIELDS
+
+    id = column_property("id")
+    name = column_property("name")
+    category = column_property("category")
+    quantity = column_property("quantity")
+    price = column_property("price")
+    status = column_property("status")
+
+    def __init__(self, store, slot):
+        self.store = store
+        self.slot = slot
+
+
+class ColumnarStore:
+    """Inventory kept in columns instead of one object per item
+
+    Quantities and prices live in typed arrays, categories and statuses as
+    interned codes (one byte each until a column needs more than 255), and
+    names in a UTF-8 string heap. Rows are exposed as
+    ColumnarRow views created on first access, so the rest of the app uses
+    the same API as with ItemStore. Deleted rows are zeroed out and the
+    columns are compacted once they make up half of the rows.
+    """
+
+    def __init__(self, records=()):
+        self.ids = []
+        self.name_heap = bytearray()
+        self.name_starts = array('Q')
+        self.name_lengths = array('I')
+        self.quantities = array('i')
+        self.prices = array('d')
+        self.category_codes = array('B')
+        self.status_codes = array('B')
+        self.categories = CodeTable()
+        self.statuses = CodeTable()
+        self.views = []
+        # Slot of each live id, and the live slots in order once rows were deleted
+        self.slots = {}
+        self.live_slots = None
+        self.dead = 0
+        for record in records:
+            self.add(record)
+
+    @classmethod
+    def from_dicts(cls, record_class, dicts):
+        """Load JSON-schema item dicts straight into the columns"""
+        store = cls()
+        for data in dicts:
+            store.add_loaded(data)
+        return store
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __iter__(self):
+        return map(self.view, self.slots.values())
+
+    def __contains__(self, record_id):
+        return record_id in self.slots
+
+    def __getitem__(self, index):
+        if not self.dead:
+            return self.view(range(len(self.ids))[index])
+        if self.live_slots is None:
+            self.live_slots = array('Q', self.slots.values())
+        return self.view(self.live_slots[index])
+
+    def view(self, slot):
+        """The row view for a slot, created on first access"""
+        row = self.views[slot]
+        if row is None:
+            row = self.views[slot] = ColumnarRow(self, slot)
+        return row
+
+    def read(self, slot, field):
+        """One field of a row"""
+        if field == "quantity":
+            return self.quantities[slot]
+        if field == "price":
+            return self.prices[slot]
+        if field == "category":
+            return self.categories.values[self.category_codes[slot]]
+        if field == "status":
+            return self.statuses.values[self.status_codes[slot]]
+        if field == "name":
+            start = self.name_starts[slot]
+            return self.name_heap[start:start + self.name_lengths[slot]].decode()
+        return self.ids[slot]
+
+    def write(self, slot, field, value):
+        """Change one field of a row"""
+        if field == "quantity":
+            self.quantities[slot] = value
+        elif field == "price":
+            self.prices[slot] = value
+        elif field in ("category", "status"):
+            code = self.encode(field, value)
+            self.code_column(field)[0][slot] = code
+        elif field == "name":
+            # The old bytes stay in the heap until the next compaction
+            encoded = value.encode()
+            self.name_starts[slot] = len(self.name_heap)
+            self.name_lengths[slot] = len(encoded)
+            self.name_heap += encoded
+        else:
+            del self.slots[self.ids[slot]]
+            self.slots[value] = slot
+            self.ids[slot] = value
+
+    def get(self, record_id, default=None):
+        """Row with the given id"""
+        slot = self.slots.get(record_id)
+        return default if slot is None else self.view(slot)
+
+    def search_fields(self):
+        """(handle, id, name, category) of every row in catalog order, for SearchIndex
+
+        Read straight from the columns, so no row views are created.
+        """
+        heap, starts, lengths = self.name_heap, self.name_starts, self.name_lengths
+        ids, codes, categories = self.ids, self.category_codes, self.categories.values
+        for slot in self.slots.values():
+            start = starts[slot]
+            yield (ids[slot], ids[slot], heap[start:start + lengths[slot]].decode(),
+                   categories[codes[slot]])
+
+    def search_handle(self, row):
+        """What SearchIndex keeps for a row: its id, as slots change on compaction"""
+        return row.id
+
+    def search_item(self, handle):
+        """The row of a SearchIndex handle"""
+        return self.get(handle)
+
+    def row_dict(self, slot):
+        """A slot's values as a JSON-schema dict"""
+        return {field: self.read(slot, field) for field in ITEM_FIELDS}
+
+    def append(self, record):
+        """Copy a record or dict into a new slot and return the slot"""
+        if record["id"] in self.slots:
+            raise KeyError(f"Duplicate id {record['id']!r}")
+        slot = len(self.ids)
+        # Coding can fail, so it happens before any column grows
+        category_code = self.encode("category", record["category"])
+        status_code = self.encode("status", record["status"])
+        encoded = record["name"].encode()
+        self.ids.append(record["id"])
+        self.name_starts.append(len(self.name_heap))
+        self.name_lengths.append(len(encoded))
+        self.name_heap += encoded
+        self.quantities.append(record["quantity"])
+        self.prices.append(record["price"])
+        self.category_codes.append(category_code)
+        self.status_codes.append(status_code)
+        self.views.append(None)
+        self.slots[record["id"]] = slot
+        if self.live_slots is not None:
+            self.live_slots.append(slot)
+        return slot
+
+    def add(self, record):
+        """Append a row copied from a record or dict and return its view"""
+        return self.view(self.append(record))
+
+    def add_loaded(self, record):
+        """Append a row read from storage, renaming a clashing id in place"""
+        base, n = record["id"], 2
+        while record["id"] in self.slots:
+            record["id"] = f"{base} ({n})"
+            n += 1
+        self.append(record)
+
+    def remove(self, row):
+        """Delete a row, zeroing it out so column aggregates skip it"""
+        slot = row.slot
+        # The view moves to a store of its own and keeps its last values
+        row.store = ColumnarStore()
+        row.slot = row.store.append(self.row_dict(slot))
+        del self.slots[self.ids[slot]]
+        self.ids[slot] = self.views[slot] = None
+        self.name_lengths[slot] = 0
+        self.quantities[slot] = 0
+        self.prices[slot] = 0.0
+        self.category_codes[slot] = self.status_codes[slot] = 0
+        self.dead += 1
+        self.live_slots = None
+        if self.dead * 2 > len(self.ids) and self.dead > 1024:
+            self.compact()
+
+    def compact(self):
+        """Drop deleted rows and stale names, renumbering the live views"""
+        live = list(self.slots.values())
+        names = [self.read(slot, "name").encode() for slot in live]
+        self.name_heap = bytearray(b"".join(names))
+        self.name_lengths = array('I', map(len, names))
+        self.name_starts = array('Q', accumulate(self.name_lengths, initial=0))
+        self.name_starts.pop()
+        self.ids = [self.ids[slot] for slot in live]
+        self.quantities = array('i', (self.quantities[slot] for slot in live))
+        self.prices = array('d', (self.prices[slot] for slot in live))
+        self.category_codes = array(self.category_codes.typecode, (self.category_codes[slot] for slot in live))
+        self.status_codes = array(self.status_codes.typecode, (self.status_codes[slot] for slot in live))
+        self.views = [self.views[slot] for slot in live]
+        for new_slot, row in enumerate(self.views):
+            if row is not None:
+                row.slot = new_slot
+        self.slots = dict(zip(self.ids, range(len(live))))
+        self.dead = 0
+        self.live_slots = None
+
+    def total_units(self):
+        """Sum of all quantities"""
+        return sum(self.quantities)
+
+    def total_value(self):
+        """Sum of quantity times price over all rows"""
+        return sum(map(operator.mul, self.quantities, self.prices))
+
+    def category_values(self):
+        """Total value per category, one C-level pass per category"""
+        values = array('d', map(operator.mul, self.quantities, self.prices))
+        totals = {}
+        for category, code in self.categories.codes.items():
+            if self.category_codes.count(code):
+                totals[category] = sum(compress(values, self.categories.mask(self.category_codes, category)))
+        return totals
+
+    def code_column(self, field):
+        """Code array and code table of the category or status column"""
+        if field == "category":
+            return self.category_codes, self.categories
+        return self.status_codes, self.statuses
+
+    def encode(self, field, value):
+        """Code of a category or status, widening its column once codes pass one byte"""
+        codes, table = self.code_column(field)
+        code = table.code(value)
+        if code > 255 and codes.typecode == 'B':
+            setattr(self, f"{field}_codes", array('H', codes))
+        return code
+
+    def count_value(self, field, value):
+        """Number of rows whose category or status equals value"""
+        codes, table = self.code_column(field)
+        code = table.codes.get(value)
+        return 0 if code is None else codes.count(code)
+
+    def rows_with(self, field, value):
+        """Rows whose category or status equals value, in catalog order"""
+        codes, table = self.code_column(field)
+        if value not in table.codes:
+            return []
+        return [self.view(slot) for slot in compress(range(len(codes)), table.mask(codes, value))]
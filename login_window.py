@@ -2,16 +2,32 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QLineEdit, QPushButton, QVBoxLayout,
     QLabel, QMessageBox
 )
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import QThreadPool, QTimer
+from PyQt5.QtGui import QPixmap
+import os
 import sys
+from theme import QT_FORM_STYLE, qt_font
+from storage import open_app_storage
+from user_store import UserStore
+from workers import start_worker
 from registration import RegisterWindow    # If you use a separate registration window
-from admin_dashboard import MainWindow     # Import your dashboard
 
-# Example users dictionary
-users = {
-    "admin1": {"password": "admin123", "role": "admin"},
-    "cashier1": {"password": "cashier123", "role": "cashier"}
-}
+# Users with hashed passwords, persisted between runs
+users = UserStore(os.environ.get("HARDTRACK_USERS", "users.json"))
+
+
+def preload_data():
+    """Open the app's storage and read it; runs on a worker thread
+
+    Opening may migrate or convert the whole catalog, so it stays off the
+    GUI thread too. A failed read still hands over the storage, and the
+    dashboard then reads it again and reports the error.
+    """
+    storage = open_app_storage()
+    try:
+        return storage, storage.load()
+    except Exception:
+        return storage, None
 
 class LoginWindow(QWidget):
     def __init__(self):
@@ -19,54 +35,57 @@ class LoginWindow(QWidget):
         self.setWindowTitle("HardTrack")
         self.resize(500, 500)  # Practical window size
 
-        self.setStyleSheet("background-color: #f7fafc; border-radius: 12px;")
+        self.setStyleSheet(QT_FORM_STYLE)
+
+        self.login_worker = None
+        # Dashboard data read while the password is being checked
+        self.storage = None
+        self.preload_worker = None
+        self.preloaded = None
+        self.waiting_admin = None
+        # Set when the login ends without the dashboard while the preload runs
+        self.discard_preload = False
+        # Admin who logged in; the dashboard opens once the Qt loop has ended
+        self.dashboard_user = None
 
         self.logo_label = QLabel()
         self.logo_label.setPixmap(QPixmap("logo.png"))
 
         self.title_label = QLabel("HardTrack")
-        self.title_label.setFont(QFont("Arial", 24, QFont.Bold))
-        self.title_label.setStyleSheet("color: #3069f1; margin-top: 8px; margin-bottom: 6px;")
+        self.title_label.setFont(qt_font(24, bold=True))
+        self.title_label.setObjectName("title")
 
         self.subtitle_label = QLabel("Enter your details")
-        self.subtitle_label.setFont(QFont("Arial", 10))
-        self.subtitle_label.setStyleSheet("color: #444; margin-bottom: 10px;")
+        self.subtitle_label.setFont(qt_font(10))
+        self.subtitle_label.setObjectName("subtitle")
 
         self.username_label = QLabel("Username")
-        self.username_label.setFont(QFont("Arial", 13, QFont.Bold))
-        self.username_label.setStyleSheet("color: #333; margin-bottom: 1px;")
+        self.username_label.setFont(qt_font(13, bold=True))
+        self.username_label.setObjectName("fieldLabel")
 
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username")
-        self.username_input.setFont(QFont("Arial", 12))
-        self.username_input.setStyleSheet(
-            "padding: 9px; border-radius: 8px; border: 1px solid #cccccc; margin-bottom: 3px; background: #ffffff"
-        )
+        self.username_input.setFont(qt_font(12))
+        self.username_input.setObjectName("fieldInput")
 
         self.password_label = QLabel("Password")
-        self.password_label.setFont(QFont("Arial", 13, QFont.Bold))
-        self.password_label.setStyleSheet("color: #333; margin-bottom: 1px;")
+        self.password_label.setFont(qt_font(13, bold=True))
+        self.password_label.setObjectName("fieldLabel")
 
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFont(QFont("Arial", 12))
-        self.password_input.setStyleSheet(
-            "padding: 9px; border-radius: 8px; border: 1px solid #cccccc; margin-bottom: 8px; background: #ffffff"
-        )
+        self.password_input.setFont(qt_font(12))
+        self.password_input.setObjectName("lastFieldInput")
 
         self.login_button = QPushButton("Login")
         self.login_button.clicked.connect(self.check_login)
-        self.login_button.setFont(QFont("Arial", 13, QFont.Bold))
-        self.login_button.setStyleSheet(
-            "background-color: #3069f1; color: white; padding: 10px; border: none; border-radius: 8px; margin-top: 7px;"
-        )
+        self.login_button.setFont(qt_font(13, bold=True))
+        self.login_button.setObjectName("primaryButton")
 
         self.registration_button = QPushButton("Register new user")
-        self.registration_button.setFont(QFont("Arial", 12, QFont.Bold))
-        self.registration_button.setStyleSheet(
-            "color: #3069f1; background: transparent; border: none; margin-top: 20px;"
-        )
+        self.registration_button.setFont(qt_font(12, bold=True))
+        self.registration_button.setObjectName("linkButton")
         self.registration_button.clicked.connect(self.open_registration)
 
         layout = QVBoxLayout()
@@ -83,29 +102,107 @@ class LoginWindow(QWidget):
         layout.addWidget(self.registration_button)
         self.setLayout(layout)
 
+        if not len(users):
+            # First run: there are no accounts yet, so set up the admin's
+            self.subtitle_label.setText("Register the administrator account to get started")
+            QTimer.singleShot(0, self.open_registration)
+
     def check_login(self):
         username = self.username_input.text()
         password = self.password_input.text()
-        if username in users and users[username]["password"] == password:
-            if users[username]["role"] == "admin":
-                QMessageBox.information(self, "Login Successfully", f"Welcome, {username} (Admin)")
-                self.dashboard_win = MainWindow()  # This loads the dashboard from admin_dashboard.py
-                self.dashboard_win.show()
-                self.close()
+        # The password hash is deliberately slow, so check it off the GUI thread
+        self.login_button.setEnabled(False)
+        self.login_worker = start_worker(
+            users.verify, username, password,
+            on_finished=lambda role: self.finish_login(username, role),
+            on_failed=lambda error: self.finish_login(username, None))
+        self.start_preload()
+
+    def start_preload(self):
+        # Open and read the dashboard's data in parallel with the password check
+        if self.preload_worker is not None:
+            # Still running from an earlier attempt: keep its result after all
+            self.discard_preload = False
+            return
+        if self.storage is not None:
+            return
+        self.preload_worker = start_worker(
+            preload_data,
+            on_finished=self.finish_preload,
+            on_failed=lambda error: self.finish_preload((None, None)))
+
+    def finish_preload(self, result):
+        self.preload_worker = None
+        # Without a storage (it could not be opened) the dashboard opens its own
+        self.storage, self.preloaded = result
+        if self.discard_preload:
+            self.release_preload()
+        elif self.waiting_admin is not None:
+            self.open_dashboard(self.waiting_admin)
+
+    def release_preload(self):
+        # The dashboard is not opening: close the preloaded storage, or have
+        # finish_preload close it once it arrives
+        if self.preload_worker is not None:
+            self.discard_preload = True
+            return
+        self.discard_preload = False
+        if self.storage is not None:
+            # Closed here rather than on a worker so a retry never opens it while it closes
+            self.storage.close()
+        self.storage = self.preloaded = None
+
+    def finish_login(self, username, role):
+        self.login_worker = None
+        self.login_button.setEnabled(True)
+        if role is not None:
+            if role == "admin":
+                if self.preload_worker is not None:
+                    # Open the dashboard once its data is in memory
+                    self.waiting_admin = username
+                    self.login_button.setEnabled(False)
+                    self.login_button.setText("Loading...")
+                else:
+                    self.open_dashboard(username)
             else:
+                self.release_preload()
                 QMessageBox.information(self, "Login Successfully", f"Welcome, {username} (Cashier)")
                 # You could show a different dashboard for cashiers here if desired
         else:
+            self.release_preload()
             QMessageBox.warning(self, "Login Failed", "Invalid Credentials")
             self.password_input.clear()
             self.password_input.setFocus()
 
+    def open_dashboard(self, username):
+        self.waiting_admin = None
+        QMessageBox.information(self, "Login Successfully", f"Welcome, {username} (Admin)")
+        self.dashboard_user = username
+        self.close()
+        # Leave app.exec_() so Tk's loop does not run nested inside this slot
+        QApplication.quit()
+
     def open_registration(self):
-        self.register_win = RegisterWindow(users)
+        self.register_win = RegisterWindow(users, "admin" if not len(users) else "user")
         self.register_win.show()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = LoginWindow()
-    window.show()
-    sys.exit(app.exec_())
+    while True:
+        window = LoginWindow()
+        window.show()
+        status = app.exec_()
+        if window.dashboard_user is None:
+            # Closed without logging in as admin: take the result of a preload
+            # still running and close its storage
+            window.waiting_admin = None
+            QThreadPool.globalInstance().waitForDone()
+            app.processEvents()
+            window.release_preload()
+            sys.exit(status)
+        # Imported only now, so cashiers never load customtkinter/Tk
+        from admin_dashboard import InventoryDashboard
+        dashboard = InventoryDashboard(window.storage, window.preloaded)
+        dashboard.mainloop()
+        if not dashboard.logged_out:
+            sys.exit(0)
@@ -0,0 +1,95 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from atomic_file import atomic_write
+
+# Instrumentation is only installed when HARDTRACK_PERF=1; otherwise timed()
+# returns the function unchanged and nothing here costs anything
+ENABLED = os.environ.get("HARDTRACK_PERF") == "1"
+TRACE_PATH = os.environ.get("HARDTRACK_PERF_TRACE", "hardtrack_trace.json")
+
+
+class Tracer:
+    """Recorded spans and event loop lag samples, oldest dropped past limit"""
+
+    def __init__(self, limit=100_000):
+        self.events = deque(maxlen=limit)
+        # Duration of the latest call per span name, and the worst loop lag
+        self.latest = {}
+        self.last_span = None
+        self.lag = 0.0
+        self.worst_lag = 0.0
+
+    def record(self, name, start, duration, category="span"):
+        """Store one finished span (times in perf_counter seconds)"""
+        self.events.append((name, category, start, duration, threading.get_ident()))
+        if category == "lag":
+            self.lag = duration
+            self.worst_lag = max(self.worst_lag, duration)
+        else:
+            self.latest[name] = duration
+            self.last_span = name
+
+    def summary(self):
+        """One-line readout of the loop lag and the latest span"""
+        text = f"Loop lag {self.lag * 1000:.0f} ms (worst {self.worst_lag * 1000:.0f} ms)"
+        if self.last_span is not None:
+            text += f" | {self.last_span} {self.latest[self.last_span] * 1000:.1f} ms"
+        return text
+
+    def dump(self, path):
+        """Write the events in the Chrome trace format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = [{
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": duration * 1e6,
+            "pid": pid,
+            "tid": tid
+        } for name, category, start, duration, tid in list(self.events)]
+        with atomic_write(path) as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+tracer = Tracer()
+
+
+def timed(name):
+    """Decorator recording every call of a function as a span when instrumentation is on"""
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.record(name, start, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+class LoopLagMonitor:
+    """Measures how late Tk runs an after() callback, i.e. how long the loop was blocked"""
+
+    def __init__(self, widget, interval_ms=100):
+        self.widget = widget
+        self.interval = interval_ms / 1000
+        self.interval_ms = interval_ms
+        self.expected = time.perf_counter() + self.interval
+        self.widget.after(interval_ms, self.tick)
+
+    def tick(self):
+        """Record the delay of this callback and schedule the next one"""
+        now = time.perf_counter()
+        tracer.record("loop lag", self.expected, max(0.0, now - self.expected), "lag")
+        self.expected = now + self.interval
+        self.widget.after(self.interval_ms, self.tick)
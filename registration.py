@@ -1,35 +1,39 @@
 from PyQt5.QtWidgets import QWidget, QLineEdit, QPushButton, QVBoxLayout, QLabel, QMessageBox
-from PyQt5.QtGui import QFont
+from theme import QT_FORM_STYLE, qt_font
+from workers import start_worker
 
 class RegisterWindow(QWidget):
-    def __init__(self, users):
+    def __init__(self, users, role="user"):
         super().__init__()
-        self.setWindowTitle("HardTrack - Registration")
+        # The first account of a new install is registered as the admin
+        self.setWindowTitle("HardTrack - Administrator Setup" if role == "admin" else "HardTrack - Registration")
         self.resize(800, 800)
-        self.setStyleSheet("background-color: #f7fafc; border-radius: 12px;")
+        self.setStyleSheet(QT_FORM_STYLE)
 
         self.users = users
+        self.role = role
+        self.register_worker = None
 
         self.username_label = QLabel("Register Username")
-        self.username_label.setFont(QFont("Arial", 13, QFont.Bold))
-        self.username_label.setStyleSheet("color: #333; margin-bottom: 1px;")
+        self.username_label.setFont(qt_font(13, bold=True))
+        self.username_label.setObjectName("fieldLabel")
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Enter new username")
-        self.username_input.setFont(QFont("Arial", 12))
-        self.username_input.setStyleSheet("padding: 9px; border-radius: 8px; border: 1px solid #cccccc; margin-bottom: 3px; background: #ffffff")
+        self.username_input.setFont(qt_font(12))
+        self.username_input.setObjectName("fieldInput")
 
         self.password_label = QLabel("Register Password")
-        self.password_label.setFont(QFont("Arial", 13, QFont.Bold))
-        self.password_label.setStyleSheet("color: #333; margin-bottom: 1px;")
+        self.password_label.setFont(qt_font(13, bold=True))
+        self.password_label.setObjectName("fieldLabel")
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Enter new password")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setFont(QFont("Arial", 12))
-        self.password_input.setStyleSheet("padding: 9px; border-radius: 8px; border: 1px solid #cccccc; margin-bottom: 8px; background: #ffffff")
+        self.password_input.setFont(qt_font(12))
+        self.password_input.setObjectName("lastFieldInput")
 
         self.register_button = QPushButton("Register")
-        self.register_button.setFont(QFont("Arial", 13, QFont.Bold))
-        self.register_button.setStyleSheet("background-color: #3069f1; color: white; padding: 10px; border: none; border-radius: 8px; margin-top: 7px;")
+        self.register_button.setFont(qt_font(13, bold=True))
+        self.register_button.setObjectName("primaryButton")
         self.register_button.clicked.connect(self.register_account)
 
         layout = QVBoxLayout()
@@ -48,9 +52,20 @@ class RegisterWindow(QWidget):
         if not username or not password:
             QMessageBox.warning(self, "Error", "Both fields are required.")
             return
-        if username in self.users:
+        # Hashing the password is slow on purpose, so it runs off the GUI thread
+        self.register_button.setEnabled(False)
+        self.register_worker = start_worker(
+            self.users.add_user, username, password, self.role,
+            on_finished=lambda result: self.finish_registration(username, None),
+            on_failed=lambda error: self.finish_registration(username, error))
+
+    def finish_registration(self, username, error):
+        self.register_worker = None
+        self.register_button.setEnabled(True)
+        if isinstance(error, KeyError):
             QMessageBox.warning(self, "Error", "Username already exists.")
+        elif error is not None:
+            QMessageBox.warning(self, "Error", f"Could not register user: {error}")
         else:
-            self.users[username] = {"password": password, "role": "user"}
             QMessageBox.information(self, "Success", f"User '{username}' has been registered!")
             self.close()
@@ -0,0 +1,107 @@
+import argparse
+import csv
+import json
+import os
+import sys
+
+from item_store import ITEM_FIELDS
+from reports import iter_report, running_totals
+from storage import open_storage
+
+# Command line names of the dashboard's report types
+REPORTS = {
+    "status": "Inventory Status",
+    "low-stock": "Low Stock Alert",
+    "out-of-stock": "Out of Stock Items",
+    "value": "Total Inventory Value",
+}
+
+# Status shown by the alert reports
+REPORT_STATUS = {"Low Stock Alert": "Low Stock", "Out of Stock Items": "Out of Stock"}
+
+VALUE_FIELDS = ("category", "products", "units", "value")
+
+
+def iter_inventory(path):
+    """Yield the items stored at path without changing any file"""
+    journal = any(os.path.exists(path + suffix) for suffix in (".journal", ".journal.old"))
+    storage = open_storage(path, journal=journal, migrate=False)
+    try:
+        yield from storage.iter_inventory()
+    finally:
+        # Closing a journal folds it into the snapshot; leave that to the app
+        if not journal:
+            storage.close()
+
+
+def report_rows(report_type, items):
+    """Field names and a row iterator of a report for CSV and JSON output"""
+    if report_type == "Total Inventory Value":
+        stats = running_totals(items)
+        rows = [{"category": category, "products": stats.category_counts[category],
+                 "units": stats.category_units[category], "value": round(value, 2)}
+                for category, value in stats.category_values.items()]
+        rows.append({"category": "TOTAL", "products": stats.count,
+                     "units": stats.total_units, "value": round(stats.total_value, 2)})
+        return VALUE_FIELDS, iter(rows)
+
+    status = REPORT_STATUS.get(report_type)
+    if status is not None:
+        items = (item for item in items if item["status"] == status)
+    return ITEM_FIELDS, (item.to_dict() for item in items)
+
+
+def write_report(report_type, items, output_format, out):
+    """Write one report in the given format to an open file"""
+    if output_format == "text":
+        for piece in iter_report(report_type, items):
+            out.write(piece)
+        out.write("\n")
+        return
+
+    fields, rows = report_rows(report_type, items)
+    if output_format == "csv":
+        writer = csv.DictWriter(out, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        # Written row by row rather than with json.dump so nothing is buffered
+        out.write("[")
+        separator = "\n"
+        for row in rows:
+            out.write(separator + json.dumps(row))
+            separator = ",\n"
+        out.write("\n]\n")
+
+
+def main(argv=None):
+    """Command line entry point; never imports Tk so it runs without a display"""
+    parser = argparse.ArgumentParser(description="Write an inventory report without starting the GUI")
+    parser.add_argument("report", choices=REPORTS, help="report to generate")
+    parser.add_argument("--data", default=os.environ.get("HARDTRACK_DATA", "inventory_data.json"),
+                        help="JSON data file or SQLite database (default: $HARDTRACK_DATA or inventory_data.json)")
+    parser.add_argument("--format", choices=("text", "csv", "json"), default="text",
+                        help="output format (default: text)")
+    parser.add_argument("-o", "--output", help="file to write instead of stdout")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.data):
+        parser.error(f"no data file at {args.data}")
+
+    items = iter_inventory(args.data)
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            write_report(REPORTS[args.report], items, args.format, out)
+    else:
+        try:
+            write_report(REPORTS[args.report], items, args.format, sys.stdout)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader (e.g. head) went away; keep Python from failing on exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
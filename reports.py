@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from itertools import islice
+
+from inventory_index import InventoryStats
+
+REPORT_TYPES = ["Inventory Status", "Low Stock Alert", "Out of Stock Items", "Total Inventory Value"]
+
+RULE = "=" * 50 + "\n\n"
+
+
+def inventory_status(items):
+    """Every item with its category, quantity, price and status"""
+    yield "INVENTORY STATUS REPORT\n" + RULE
+    for item in items:
+        yield (f"ID: {item['id']} | {item['name']}\n"
+               f"Category: {item['category']} | Qty: {item['quantity']} | Price: ${item['price']:.2f}\n"
+               f"Status: {item['status']}\n\n")
+
+
+def low_stock_alert(items):
+    """Items whose status is Low Stock"""
+    yield "LOW STOCK ALERT\n" + RULE
+    empty = True
+    for item in items:
+        empty = False
+        yield (f"⚠️  {item['name']} (ID: {item['id']})\n"
+               f"Current Quantity: {item['quantity']}\n"
+               f"Price: ${item['price']:.2f}\n\n")
+    if empty:
+        yield "No low stock items found!"
+
+
+def out_of_stock(items):
+    """Items whose status is Out of Stock"""
+    yield "OUT OF STOCK ITEMS\n" + RULE
+    empty = True
+    for item in items:
+        empty = False
+        yield (f"❌ {item['name']} (ID: {item['id']})\n"
+               f"Price: ${item['price']:.2f}\n"
+               f"Category: {item['category']}\n\n")
+    if empty:
+        yield "No out of stock items!"
+
+
+def total_value(stats):
+    """Product, unit and value totals with a per-category breakdown"""
+    yield ("TOTAL INVENTORY VALUE REPORT\n" + RULE
+           + f"Total Products: {stats.count}\n"
+           f"Total Units: {stats.total_units}\n"
+           f"Total Inventory Value: ${stats.total_value:,.2f}\n\n"
+           "BREAKDOWN BY CATEGORY:\n")
+    for cat, value in stats.category_values.items():
+        yield f"{cat}: ${value:,.2f}\n"
+
+
+def iter_report(report_type, items, stats=None, status_index=None):
+    """Yield the text of a report one section at a time
+
+    The header comes first and then one piece per item, so callers can show
+    the start of a long report before the rest has been formatted. Without
+    the dashboard's stats and status index, items is read in a single pass
+    and may be any iterable, such as a backend's iter_inventory().
+    """
+    if report_type == "Inventory Status":
+        return inventory_status(items)
+    if report_type == "Low Stock Alert":
+        return low_stock_alert(items_with_status(items, status_index, "Low Stock"))
+    if report_type == "Out of Stock Items":
+        return out_of_stock(items_with_status(items, status_index, "Out of Stock"))
+    if report_type == "Total Inventory Value":
+        return total_value(stats if stats is not None else running_totals(items))
+    raise ValueError(f"Unknown report type {report_type!r}")
+
+
+def items_with_status(items, status_index, status):
+    """Items with a status, from the index when there is one"""
+    if status_index is not None:
+        return status_index.items(status)
+    return (item for item in items if item["status"] == status)
+
+
+def running_totals(items):
+    """InventoryStats totals summed in one pass without per-item entries"""
+    stats = InventoryStats()
+    for item in items:
+        stats.apply((item["status"], item["quantity"], item["price"], item["category"]), 1)
+    return stats
+
+
+def batched_text(pieces, size):
+    """Join report pieces into strings of up to size pieces each"""
+    pieces = iter(pieces)
+    while True:
+        batch = "".join(islice(pieces, size))
+        if not batch:
+            return
+        yield batch
+
+
+class ReportCache:
+    """Finished reports keyed by report type and data version, least recently used evicted first
+
+    The data version only grows, so entries for older versions can never be
+    hit again and are dropped as soon as a report for a newer one is stored.
+    """
+
+    def __init__(self, capacity=8):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+
+    def get(self, report_type, version):
+        """Text batches of a cached report, or None"""
+        key = (report_type, version)
+        batches = self.entries.get(key)
+        if batches is not None:
+            self.entries.move_to_end(key)
+        return batches
+
+    def put(self, report_type, version, batches):
+        """Store the text batches of a finished report"""
+        for key in [key for key in self.entries if key[1] != version]:
+            del self.entries[key]
+        self.entries[(report_type, version)] = batches
+        self.entries.move_to_end((report_type, version))
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
@@ -0,0 +1,157 @@
+from array import array
+
+
+class SearchIndex:
+    """In-memory index for live inventory search over a store
+
+    Items are found by an exact match on their id, or by a substring of their
+    name and category. Every row is numbered in catalog order and each one to
+    three character substring of its text maps to an array of those numbers.
+    Queries of up to three characters are a single lookup; longer ones
+    intersect their trigrams and check the rows found against the store.
+    Rows hold the store's handle for an item (see search_fields), so the
+    index keeps no copy of the items or their text and builds none of them.
+    """
+
+    GRAM = 3
+
+    def __init__(self, store):
+        self.store = store
+        self.build()
+
+    def build(self):
+        """Index every row of the store from scratch"""
+        # Store handle of each row, None once the item was removed
+        self.handles = []
+        # Row per lowercased id, plus the rare ids differing from another only in case
+        self.rows = {}
+        self.case_rows = {}
+        # Hash of the text each row was last indexed with
+        self.hashes = array('q')
+        self.postings = {}
+        # Rows removed or re-indexed since the build, whose old postings remain
+        self.stale = 0
+        for handle, item_id, name, category in self.store.search_fields():
+            self.index_row(handle, item_id, self.text(name, category))
+
+    @staticmethod
+    def text(name, category):
+        """The searchable text of an item"""
+        return f"{name} {category}".lower()
+
+    def grams(self, text):
+        """Substrings of the text of one to GRAM characters"""
+        return {text[i:i + n] for n in range(1, self.GRAM + 1) for i in range(len(text) - n + 1)}
+
+    def post(self, row, text):
+        """Add a row to the postings of its text's grams"""
+        postings = self.postings
+        for gram in self.grams(text):
+            rows = postings.get(gram)
+            if rows is None:
+                rows = postings[gram] = array('I')
+            rows.append(row)
+
+    def index_row(self, handle, item_id, text):
+        """Number a new row and post its text"""
+        row = len(self.handles)
+        self.handles.append(handle)
+        key = str(item_id).lower()
+        if key in self.rows:
+            self.case_rows[item_id] = row
+        else:
+            self.rows[key] = row
+        self.hashes.append(hash(text))
+        self.post(row, text)
+
+    def row_of(self, item):
+        """Row of an indexed item, or None"""
+        row = self.rows.get(str(item["id"]).lower())
+        if row is None or self.handles[row] != self.store.search_handle(item):
+            row = self.case_rows.get(item["id"])
+        return row
+
+    def add(self, item):
+        """Index an item at the end of the catalog order"""
+        if self.row_of(item) is not None:
+            self.update(item)
+            return
+        self.index_row(self.store.search_handle(item), item["id"], self.text(item["name"], item["category"]))
+
+    def update(self, item):
+        """Re-index an edited item, keeping its place in the catalog order"""
+        row = self.row_of(item)
+        if row is None:
+            self.add(item)
+            return
+        text = self.text(item["name"], item["category"])
+        if self.hashes[row] == hash(text):
+            # Only fields outside the index changed, such as the quantity
+            return
+        self.hashes[row] = hash(text)
+        self.post(row, text)
+        self.stale += 1
+        self.compact_if_stale()
+
+    def remove(self, item):
+        """Remove an item; its postings are skipped until the next rebuild"""
+        row = self.row_of(item)
+        if row is None:
+            return
+        if self.case_rows.get(item["id"]) == row:
+            del self.case_rows[item["id"]]
+        else:
+            del self.rows[str(item["id"]).lower()]
+        self.handles[row] = None
+        self.stale += 1
+        self.compact_if_stale()
+
+    def compact_if_stale(self):
+        """Rebuild once stale postings make up a quarter of the rows"""
+        if self.stale > 1024 and self.stale * 4 > len(self.handles):
+            self.build()
+
+    def search(self, query):
+        """Items matching the query, id matches first, then in catalog order"""
+        query = query.strip().lower()
+        if not query:
+            return list(self.store)
+
+        id_row = self.rows.get(query)
+        id_rows = [id_row] if id_row is not None else []
+        id_rows.extend(sorted(row for item_id, row in self.case_rows.items() if str(item_id).lower() == query))
+
+        if len(query) <= self.GRAM:
+            grams = [query]
+        else:
+            grams = [query[i:i + self.GRAM] for i in range(len(query) - self.GRAM + 1)]
+        # Intersect the postings smallest first, skipping repeats of the same
+        # rows (a category's grams all share one set of rows)
+        postings = []
+        for rows in sorted((self.postings.get(gram, array('I')) for gram in grams), key=len):
+            if not any(len(rows) == len(seen) and rows == seen for seen in postings):
+                postings.append(rows)
+        matches = set(postings[0])
+        for rows in postings[1:]:
+            if not matches:
+                break
+            matches.intersection_update(rows)
+        matches.difference_update(id_rows)
+
+        handles = self.handles
+        item_of = self.store.search_item
+        results = [item_of(handles[row]) for row in id_rows]
+        if len(grams) == 1 and not self.stale:
+            # One gram and no stale postings: the rows found are exact
+            results.extend(item_of(handles[row]) for row in sorted(matches))
+            return results
+        # The store has the current text: it drops trigram chains that are
+        # not contiguous and rows edited or removed since they were posted
+        for row in sorted(matches):
+            handle = handles[row]
+            if handle is None:
+                continue
+            item = item_of(handle)
+            if query in f"{item.name} {item.category}".lower():
+                results.append(item)
+        return results
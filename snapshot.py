@@ -0,0 +1,401 @@
+import argparse
+import heapq
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from atomic_file import atomic_write
+from item_store import InventoryItem, ItemStore
+
+# File layout, all little-endian:
+#   header   magic, item count, offsets of the records, heap and metadata, metadata size
+#   index    one u64 slot per item, ordered by the UTF-8 bytes of the item ids
+#   records  one fixed-width record per item, in catalog order
+#   heap     UTF-8 ids and names the records point into
+#   groups   u64 slots per category code in code order, then per status code,
+#            each run in slot order
+#   meta     JSON with the category and status tables, their counts, units and
+#            values per code, the offset of the groups, the suppliers and the generation
+MAGIC = b"HTSNAP01"
+HEADER = struct.Struct("<8sQQQQQ")
+SLOT = struct.Struct("<Q")
+# id offset, id length, name offset, name length, quantity, price, category code, status code
+RECORD = struct.Struct("<QIQIqdHH")
+ID_REF = struct.Struct("<QI")
+
+
+def write_snapshot(path, inventory, suppliers, generation=0):
+    """Write items and suppliers (records or dicts) as a snapshot, atomically
+
+    Items are packed as they are read, so the inventory may be any
+    iterable; ids stored twice are renamed like ItemStore.add_loaded does.
+    The generation tells a journal of later changes which snapshot it
+    applies to. The totals and slot groups per category and status code
+    are gathered in the same pass, so opening the file needs no scan.
+    """
+    records = bytearray()
+    heap = bytearray()
+    ids = {}
+    codes = {"category": {}, "status": {}}
+    # Slots per code, in code order as codes are handed out in order
+    groups = {"category": {}, "status": {}}
+    category_units = {}
+    category_values = {}
+    for item in inventory:
+        item_id, n = item["id"], 2
+        while item_id in ids:
+            item_id = f"{item['id']} ({n})"
+            n += 1
+        slot = ids[item_id] = len(ids)
+        encoded_id = item_id.encode()
+        encoded_name = item["name"].encode()
+        id_offset = len(heap)
+        heap += encoded_id
+        name_offset = len(heap)
+        heap += encoded_name
+        category = codes["category"].setdefault(item["category"], len(codes["category"]))
+        status = codes["status"].setdefault(item["status"], len(codes["status"]))
+        groups["category"].setdefault(category, array('Q')).append(slot)
+        groups["status"].setdefault(status, array('Q')).append(slot)
+        # Summed as RECORD stores them, the price as a double
+        category_units[category] = category_units.get(category, 0) + item["quantity"]
+        category_values[category] = category_values.get(category, 0.0) + item["quantity"] * float(item["price"])
+        records += RECORD.pack(id_offset, len(encoded_id), name_offset, len(encoded_name),
+                               item["quantity"], item["price"], category, status)
+
+    index = array('Q', (slot for item_id, slot in sorted(ids.items(), key=lambda entry: entry[0].encode())))
+    slot_runs = [*groups["category"].values(), *groups["status"].values()]
+    if sys.byteorder == "big":
+        index.byteswap()
+        for slots in slot_runs:
+            slots.byteswap()
+
+    records_offset = HEADER.size + len(index) * SLOT.size
+    heap_offset = records_offset + len(records)
+    groups_offset = heap_offset + len(heap)
+    meta_offset = groups_offset + 2 * len(ids) * SLOT.size
+    meta = json.dumps({
+        "categories": list(codes["category"]),
+        "statuses": list(codes["status"]),
+        "category_counts": [len(slots) for slots in groups["category"].values()],
+        "category_units": list(category_units.values()),
+        "category_values": list(category_values.values()),
+        "status_counts": [len(slots) for slots in groups["status"].values()],
+        "groups_offset": groups_offset,
+        "suppliers": [{field: supplier[field] for field in supplier.keys()} for supplier in suppliers],
+        "generation": generation
+    }).encode()
+
+    with atomic_write(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(ids), records_offset, heap_offset, meta_offset, len(meta)))
+        f.write(index.tobytes())
+        f.write(records)
+        f.write(heap)
+        for slots in slot_runs:
+            f.write(slots.tobytes())
+        f.write(meta)
+
+
+class Snapshot:
+    """Read-only view of a snapshot file through mmap
+
+    Opening reads the header and the small metadata block only; records,
+    strings, the id index and the slot groups are read from the mapping
+    when asked for. Files written before the totals and groups were stored
+    have None for them, and their users scan the records instead.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.records_offset, self.heap_offset, meta_offset, meta_size = \
+            HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a snapshot file")
+        meta = json.loads(self.map[meta_offset:meta_offset + meta_size])
+        self.categories = meta["categories"]
+        self.statuses = meta["statuses"]
+        self.suppliers = meta["suppliers"]
+        self.generation = meta.get("generation", 0)
+        self.category_counts = meta.get("category_counts")
+        self.category_units = meta.get("category_units")
+        self.category_values = meta.get("category_values")
+        self.status_counts = meta.get("status_counts")
+        self.groups_offset = meta.get("groups_offset")
+        # (first slot index, count) of each code's run in the groups, per field
+        self.groups = {}
+        if self.groups_offset is not None:
+            start = 0
+            for field, values, counts in (("category", self.categories, self.category_counts),
+                                          ("status", self.statuses, self.status_counts)):
+                self.groups[field] = {}
+                for value, count in zip(values, counts):
+                    self.groups[field][value] = (start, count)
+                    start += count
+
+    def __len__(self):
+        return self.count
+
+    def string(self, offset, length):
+        """Decode a string from the heap"""
+        start = self.heap_offset + offset
+        return self.map[start:start + length].decode()
+
+    def record(self, slot):
+        """One item as a dict in the JSON schema"""
+        id_offset, id_length, name_offset, name_length, quantity, price, category, status = \
+            RECORD.unpack_from(self.map, self.records_offset + slot * RECORD.size)
+        return {
+            "id": self.string(id_offset, id_length),
+            "name": self.string(name_offset, name_length),
+            "category": self.categories[category],
+            "quantity": quantity,
+            "price": price,
+            "status": self.statuses[status]
+        }
+
+    def entry(self, slot):
+        """(status, quantity, price, category) of one item, as InventoryStats counts it"""
+        quantity, price, category, status = struct.unpack_from(
+            "<qdHH", self.map, self.records_offset + slot * RECORD.size + ID_REF.size * 2)
+        return self.statuses[status], quantity, price, self.categories[category]
+
+    def iter_records(self):
+        """Unpacked record tuples in slot order, straight from the mapping"""
+        with memoryview(self.map) as view:
+            yield from RECORD.iter_unpack(view[self.records_offset:self.heap_offset])
+
+    def slots_with(self, field, value):
+        """Slots stored with a status or category, in slot order, or None if the file has no groups"""
+        if self.groups_offset is None:
+            return None
+        start, count = self.groups[field].get(value, (0, 0))
+        offset = self.groups_offset + start * SLOT.size
+        slots = array('Q')
+        slots.frombytes(self.map[offset:offset + count * SLOT.size])
+        if sys.byteorder == "big":
+            slots.byteswap()
+        return slots
+
+    def find(self, item_id):
+        """Slot of the item with an id, by binary search over the index"""
+        key = item_id.encode()
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            slot, = SLOT.unpack_from(self.map, HEADER.size + middle * SLOT.size)
+            offset, length = ID_REF.unpack_from(self.map, self.records_offset + slot * RECORD.size)
+            start = self.heap_offset + offset
+            current = self.map[start:start + length]
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return slot
+        return None
+
+    def close(self):
+        """Unmap the file"""
+        self.map.close()
+        self.file.close()
+
+
+class SnapshotStore:
+    """Inventory backed by a Snapshot, building each item on first access
+
+    An item is created from its record the first time it is read and then
+    kept, so every caller gets the same object and edits stick to it.
+    Added items are held in memory after the snapshot's rows and deleted
+    ones are only marked, so the mapped file is never written to. Listing
+    the items with a status or category reads the file's slot group for it
+    and checks only the items built or deleted since.
+    """
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        # Built items per slot, and the slot of each built item by identity
+        self.items = {}
+        self.slots = {}
+        # Deleted items per slot, kept so their identity stays unique
+        self.deleted = {}
+        self.added = ItemStore()
+        self.live_slots = None
+
+    def __len__(self):
+        return len(self.snapshot) - len(self.deleted) + len(self.added)
+
+    def __iter__(self):
+        for slot in self.iter_slots():
+            yield self.view(slot)
+        yield from self.added
+
+    def __contains__(self, record_id):
+        return self.get(record_id) is not None
+
+    def __getitem__(self, index):
+        total = len(self)
+        if index < 0:
+            index += total
+        if not 0 <= index < total:
+            raise IndexError("SnapshotStore index out of range")
+        live = total - len(self.added)
+        if index >= live:
+            return self.added[index - live]
+        if not self.deleted:
+            return self.view(index)
+        if self.live_slots is None:
+            self.live_slots = array('Q', self.iter_slots())
+        return self.view(self.live_slots[index])
+
+    def iter_slots(self):
+        """Slots of the snapshot rows that were not deleted"""
+        if not self.deleted:
+            return iter(range(len(self.snapshot)))
+        return (slot for slot in range(len(self.snapshot)) if slot not in self.deleted)
+
+    def view(self, slot):
+        """The item for a slot, built on first access"""
+        item = self.items.get(slot)
+        if item is None:
+            item = self.items[slot] = InventoryItem.from_dict(self.snapshot.record(slot))
+            self.slots[id(item)] = slot
+        return item
+
+    def get(self, record_id, default=None):
+        """Item with the given id"""
+        item = self.added.get(record_id)
+        if item is not None:
+            return item
+        slot = self.snapshot.find(record_id)
+        if slot is None or slot in self.deleted:
+            return default
+        return self.view(slot)
+
+    def add(self, record):
+        """Append a record and return it; its id must not be in the store yet"""
+        if record["id"] in self:
+            raise KeyError(f"Duplicate id {record['id']!r}")
+        return self.added.add(record)
+
+    def remove(self, record):
+        """Remove an item"""
+        slot = self.slots.get(id(record))
+        if slot is None:
+            self.added.remove(record)
+            return
+        self.deleted[slot] = self.items.pop(slot)
+        self.live_slots = None
+
+    def row_dict(self, slot):
+        """A slot's current values as a JSON-schema dict, without building its item"""
+        item = self.items.get(slot)
+        return item.to_dict() if item is not None else self.snapshot.record(slot)
+
+    def search_fields(self):
+        """(handle, id, name, category) of every item in catalog order, without building them
+
+        Snapshot rows are handled by their slot and added items by themselves.
+        """
+        snapshot = self.snapshot
+        categories = snapshot.categories
+        for slot, record in enumerate(snapshot.iter_records()):
+            if slot in self.deleted:
+                continue
+            item = self.items.get(slot)
+            if item is not None:
+                yield slot, item.id, item.name, item.category
+            else:
+                yield (slot, snapshot.string(record[0], record[1]), snapshot.string(record[2], record[3]),
+                       categories[record[6]])
+        for item in self.added:
+            yield item, item.id, item.name, item.category
+
+    def search_handle(self, item):
+        """What SearchIndex keeps for an item: its slot, or the item once added"""
+        return self.slots.get(id(item), item)
+
+    def search_item(self, handle):
+        """The item of a SearchIndex handle"""
+        return self.view(handle) if isinstance(handle, int) else handle
+
+    def iter_dicts(self):
+        """Every item as a JSON-schema dict, in catalog order"""
+        for slot in self.iter_slots():
+            yield self.row_dict(slot)
+        for item in self.added:
+            yield item.to_dict()
+
+    def matching_slots(self, field, value):
+        """Live slots whose status or category equals value, built items taking their current value"""
+        slots = self.snapshot.slots_with(field, value)
+        if slots is None:
+            yield from self.scan_slots(field, value)
+            return
+        if not self.items and not self.deleted:
+            yield from slots
+            return
+        # The stored group, less deleted rows and built items edited away from
+        # value, merged with built items edited to it
+        kept = (slot for slot in slots
+                if slot not in self.deleted and (slot not in self.items or self.items[slot][field] == value))
+        index = 0 if field == "status" else 3
+        moved = sorted(slot for slot, item in self.items.items()
+                       if item[field] == value and self.snapshot.entry(slot)[index] != value)
+        yield from heapq.merge(kept, moved)
+
+    def scan_slots(self, field, value):
+        """matching_slots by a scan of the records, for files without slot groups"""
+        values = self.snapshot.statuses if field == "status" else self.snapshot.categories
+        column = 7 if field == "status" else 6
+        code = values.index(value) if value in values else None
+        for slot, record in enumerate(self.snapshot.iter_records()):
+            if slot in self.deleted:
+                continue
+            item = self.items.get(slot)
+            if item is not None:
+                matches = item[field] == value
+            else:
+                matches = record[column] == code
+            if matches:
+                yield slot
+
+    def rows_with(self, field, value):
+        """Items whose status or category equals value, in catalog order"""
+        rows = [self.view(slot) for slot in self.matching_slots(field, value)]
+        rows.extend(item for item in self.added if item[field] == value)
+        return rows
+
+    def count_value(self, field, value):
+        """Number of items whose status or category equals value, without building them"""
+        groups = self.snapshot.groups.get(field)
+        if groups is not None and not self.items and not self.deleted:
+            count = groups.get(value, (0, 0))[1]
+        else:
+            count = sum(1 for slot in self.matching_slots(field, value))
+        return count + sum(1 for item in self.added if item[field] == value)
+
+
+def main(argv=None):
+    """Convert between the JSON data file and the snapshot format"""
+    # storage imports this module for its snapshot backend
+    from storage import convert_json_to_snapshot, convert_snapshot_to_json
+
+    parser = argparse.ArgumentParser(description="Convert HardTrack data between JSON and the binary snapshot format")
+    parser.add_argument("direction", choices=["to-snapshot", "to-json"], help="conversion to run")
+    parser.add_argument("source", help="file to read")
+    parser.add_argument("target", help="file to write")
+    args = parser.parse_args(argv)
+
+    if args.direction == "to-snapshot":
+        convert_json_to_snapshot(args.source, args.target)
+    else:
+        convert_snapshot_to_json(args.source, args.target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+from item_store import stock_status
+
+
+def apply_adjustments(inventory, adjustments):
+    """Apply (id, quantity delta) pairs to an inventory as one all-or-nothing batch
+
+    Deltas for the same id are summed first. Every delta must be an int
+    (not a bool), every id must exist and no quantity may drop below zero;
+    otherwise ValueError or KeyError is raised
+    before any item is changed. Statuses are recomputed for the touched
+    items only, which are returned in the order first adjusted. Callers that
+    share the inventory with the background writer hold its lock.
+    """
+    totals = {}
+    for item_id, delta in adjustments:
+        if not isinstance(delta, int) or isinstance(delta, bool):
+            raise ValueError(f"Quantity change for {item_id!r} must be a whole number, not {delta!r}")
+        totals[item_id] = totals.get(item_id, 0) + delta
+
+    changes = []
+    for item_id, delta in totals.items():
+        item = inventory.get(item_id)
+        if item is None:
+            raise KeyError(f"No product with ID {item_id!r}")
+        quantity = item["quantity"] + delta
+        if quantity < 0:
+            raise ValueError(f"Only {item['quantity']} of {item_id} in stock, cannot remove {-delta}")
+        changes.append((item, quantity))
+
+    for item, quantity in changes:
+        item["quantity"] = quantity
+        item["status"] = stock_status(quantity)
+    return [item for item, quantity in changes]
@@ -0,0 +1,846 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from atomic_file import atomic_write
+from item_store import (ITEM_FIELDS, SUPPLIER_FIELDS, ColumnarStore, InventoryItem, ItemStore,
+                        Record, Supplier)
+from snapshot import Snapshot, SnapshotStore, write_snapshot
+
+RECORD_CLASSES = {"inventory": InventoryItem, "suppliers": Supplier}
+
+
+class Storage:
+    """Persistence backend for the inventory and supplier collections
+
+    load() returns the stored records as ItemStores, attach() tells the
+    backend which stores the application edits, and the put/delete methods persist one changed
+    record at a time. save_all() rewrites everything from the attached
+    stores; write_all() does the same from given records or dict copies.
+    """
+
+    # Whether any change means rewriting the whole data set
+    rewrites_all = False
+
+    # Collection the inventory is loaded into (ItemStore or ColumnarStore)
+    inventory_class = ItemStore
+
+    def load(self):
+        """Return (inventory, suppliers) from storage"""
+        raise NotImplementedError
+
+    def iter_inventory(self):
+        """Yield the stored inventory items one at a time
+
+        Backends that can read their records incrementally override this so
+        read-only jobs run in constant memory; ids are yielded as stored.
+        """
+        yield from self.load()[0]
+
+    def attach(self, inventory, suppliers):
+        """Remember the stores the application works on"""
+        self.inventory = inventory
+        self.suppliers = suppliers
+
+    def save_all(self):
+        """Write every record of the attached stores"""
+        self.write_all(self.inventory, self.suppliers)
+
+    def write_all(self, inventory, suppliers):
+        """Replace the stored data with the given items and suppliers"""
+        raise NotImplementedError
+
+    def put_item(self, item):
+        """Persist a new or edited inventory item"""
+        raise NotImplementedError
+
+    def delete_item(self, item):
+        """Remove an inventory item from storage"""
+        raise NotImplementedError
+
+    def put_supplier(self, supplier):
+        """Persist a new or edited supplier"""
+        raise NotImplementedError
+
+    def delete_supplier(self, supplier):
+        """Remove a supplier from storage"""
+        raise NotImplementedError
+
+    def write_batch(self, changes):
+        """Persist a list of (method name, record) changes"""
+        if self.rewrites_all:
+            self.save_all()
+            return
+        for method, record in changes:
+            getattr(self, method)(record)
+
+    def close(self):
+        """Release the backend's resources"""
+
+
+class JsonStorage(Storage):
+    """The original single JSON file, rewritten on every change"""
+
+    rewrites_all = True
+
+    def __init__(self, path):
+        self.path = path
+        self.inventory = []
+        self.suppliers = []
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return self.inventory_class(), ItemStore()
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        return (self.inventory_class.from_dicts(InventoryItem, data.get("inventory", [])),
+                ItemStore.from_dicts(Supplier, data.get("suppliers", [])))
+
+    def iter_inventory(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for data in JsonArrayReader(f).iter_array("inventory"):
+                yield InventoryItem.from_dict(data)
+
+    def write_all(self, inventory, suppliers):
+        data = {
+            "inventory": list(inventory),
+            "suppliers": list(suppliers)
+        }
+        # Write to a temporary file first so a crash never truncates the data
+        with atomic_write(self.path) as f:
+            json.dump(data, f, indent=2, default=Record.to_dict)
+
+    def put_item(self, item):
+        self.save_all()
+
+    def delete_item(self, item):
+        self.save_all()
+
+    def put_supplier(self, supplier):
+        self.save_all()
+
+    def delete_supplier(self, supplier):
+        self.save_all()
+
+
+class JsonArrayReader:
+    """Incremental reader for one array inside a JSON data file
+
+    The file is read in chunks and decoded one value at a time, so only
+    the current element and a chunk of text are held in memory.
+    """
+
+    def __init__(self, f, chunk_size=64 * 1024):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self):
+        """Drop the consumed text and append the next chunk of the file"""
+        chunk = self.f.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+
+    def peek(self):
+        """Next non-whitespace character, or "" at the end of the file"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.read_more()
+
+    def expect(self, char):
+        """Consume one structural character"""
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of the data file")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+            self.read_more()
+
+    def iter_array(self, key):
+        """Yield the elements of the array stored under key in the top-level object"""
+        self.expect("{")
+        while self.peek() != "}":
+            name = self.value()
+            self.expect(":")
+            if name != key:
+                self.value()
+            else:
+                self.expect("[")
+                while self.peek() != "]":
+                    yield self.value()
+                    if self.peek() != "]":
+                        self.expect(",")
+                return
+            if self.peek() != "}":
+                self.expect(",")
+
+
+class JournalStorage(Storage):
+    """JSON snapshot plus an append-only journal of changed records
+
+    Every change appends one line to <path>.journal. Once the journal grows
+    past compact_bytes it is renamed to <path>.journal.old and a background
+    thread folds it into the snapshot. The snapshot stays a plain data file;
+    its extra "keys" entry maps records to the keys used in the journal.
+    """
+
+    def __init__(self, path, compact_bytes=1024 * 1024):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.old_journal_path = path + ".journal.old"
+        self.compact_bytes = compact_bytes
+        self.inventory = []
+        self.suppliers = []
+        # Journal key of each record, keyed by (table, record id)
+        self.keys = {}
+        self.next_key = 0
+        self.journal = None
+        self.compactor = None
+
+    def read_state(self, journal_paths):
+        """Replay the snapshot and journals into {table: {key: record}}"""
+        state = {"inventory": {}, "suppliers": {}}
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            for table, records in state.items():
+                keys = data.get("keys", {}).get(table, range(len(data.get(table, []))))
+                records.update(zip(keys, data.get(table, [])))
+
+        for path in journal_paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Torn last line from an interrupted write
+                        break
+                    records = state[entry["table"]]
+                    if entry["op"] == "put":
+                        records[entry["key"]] = entry["record"]
+                    else:
+                        records.pop(entry["key"], None)
+        return state
+
+    def load(self):
+        state = self.read_state((self.old_journal_path, self.journal_path))
+        self.keys.clear()
+        self.next_key = 0
+        stores = []
+        for table, records in state.items():
+            store = self.inventory_class() if table == "inventory" else ItemStore()
+            for key, data in records.items():
+                record = RECORD_CLASSES[table].from_dict(data)
+                store.add_loaded(record)
+                self.keys[(table, record["id"])] = key
+                self.next_key = max(self.next_key, key + 1)
+            stores.append(store)
+        return stores[0], stores[1]
+
+    def write_snapshot(self, state):
+        """Atomically replace the snapshot with the given state"""
+        data = {
+            "inventory": list(state["inventory"].values()),
+            "suppliers": list(state["suppliers"].values()),
+            "keys": {table: list(records) for table, records in state.items()}
+        }
+        with atomic_write(self.path) as f:
+            json.dump(data, f, indent=2, default=Record.to_dict)
+
+    def write_all(self, inventory, suppliers):
+        self.wait_for_compaction()
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        self.keys.clear()
+        state = {}
+        for table, records in (("inventory", inventory), ("suppliers", suppliers)):
+            state[table] = {}
+            for record in records:
+                key = self.keys[(table, record["id"])] = len(self.keys)
+                state[table][key] = record
+        self.next_key = len(self.keys)
+        self.write_snapshot(state)
+        for path in (self.old_journal_path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def append(self, table, op, record):
+        """Append one change to the journal"""
+        key = self.keys.get((table, record["id"]))
+        if key is None:
+            if op == "delete":
+                return
+            key = self.keys[(table, record["id"])] = self.next_key
+            self.next_key += 1
+        entry = {"table": table, "op": op, "key": key}
+        if op == "put":
+            entry["record"] = record
+        else:
+            del self.keys[(table, record["id"])]
+
+        if self.journal is None:
+            self.journal = open(self.journal_path, 'a')
+        self.journal.write(json.dumps(entry, default=Record.to_dict) + "\n")
+        self.journal.flush()
+
+        if self.journal.tell() > self.compact_bytes:
+            self.start_compaction()
+
+    def start_compaction(self):
+        """Rotate the journal and fold it into the snapshot in the background"""
+        if self.compactor is not None and self.compactor.is_alive():
+            return
+        if os.path.exists(self.old_journal_path):
+            # A previous run stopped mid-compaction, fold that journal first
+            self.compactor = threading.Thread(target=self.compact, daemon=True)
+            self.compactor.start()
+            return
+        self.journal.close()
+        self.journal = None
+        os.replace(self.journal_path, self.old_journal_path)
+        self.compactor = threading.Thread(target=self.compact, daemon=True)
+        self.compactor.start()
+
+    def compact(self):
+        """Fold the snapshot and the rotated journal into a new snapshot"""
+        self.write_snapshot(self.read_state((self.old_journal_path,)))
+        os.remove(self.old_journal_path)
+
+    def wait_for_compaction(self):
+        """Block until a running compaction has finished"""
+        if self.compactor is not None:
+            self.compactor.join()
+            self.compactor = None
+
+    def put_item(self, item):
+        self.append("inventory", "put", item)
+
+    def delete_item(self, item):
+        self.append("inventory", "delete", item)
+
+    def put_supplier(self, supplier):
+        self.append("suppliers", "put", supplier)
+
+    def delete_supplier(self, supplier):
+        self.append("suppliers", "delete", supplier)
+
+    def close(self):
+        """Fold the journal into the snapshot so plain readers see every change"""
+        self.wait_for_compaction()
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        journal_paths = (self.old_journal_path, self.journal_path)
+        if any(os.path.exists(path) for path in journal_paths):
+            self.write_snapshot(self.read_state(journal_paths))
+            for path in journal_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+class SqliteStorage(Storage):
+    """SQLite database in WAL mode that writes only the changed row"""
+
+    def __init__(self, path):
+        self.path = path
+        self.inventory = []
+        self.suppliers = []
+        # Row id of each loaded or inserted record, keyed by (table, record id)
+        self.rowids = {}
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS items (
+                    pk INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL,
+                    name TEXT,
+                    category TEXT,
+                    quantity INTEGER,
+                    price REAL,
+                    status TEXT
+                );
+                CREATE INDEX IF NOT EXISTS items_id ON items (id);
+                CREATE INDEX IF NOT EXISTS items_status ON items (status);
+                CREATE TABLE IF NOT EXISTS suppliers (
+                    pk INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL,
+                    name TEXT,
+                    contact TEXT,
+                    email TEXT,
+                    status TEXT
+                );
+                CREATE INDEX IF NOT EXISTS suppliers_id ON suppliers (id);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    def load(self):
+        self.rowids.clear()
+        inventory = self.load_table("items", InventoryItem, self.inventory_class())
+        suppliers = self.load_table("suppliers", Supplier, ItemStore())
+        return inventory, suppliers
+
+    def load_table(self, table, record_class, store):
+        """Read a table in insertion order into a store"""
+        fields = record_class.fields
+        cursor = self.conn.execute(f"SELECT pk, {', '.join(fields)} FROM {table} ORDER BY pk")
+        for row in cursor:
+            record = record_class(**dict(zip(fields, row[1:])))
+            store.add_loaded(record)
+            self.rowids[(table, record["id"])] = row[0]
+        return store
+
+    def iter_inventory(self):
+        fields = ITEM_FIELDS
+        cursor = self.conn.execute(f"SELECT {', '.join(fields)} FROM items ORDER BY pk")
+        for row in cursor:
+            yield InventoryItem(**dict(zip(fields, row)))
+
+    def write_all(self, inventory, suppliers):
+        with self.conn:
+            self.conn.execute("DELETE FROM items")
+            self.conn.execute("DELETE FROM suppliers")
+            self.rowids.clear()
+            for item in inventory:
+                self.write_row("items", ITEM_FIELDS, item)
+            for supplier in suppliers:
+                self.write_row("suppliers", SUPPLIER_FIELDS, supplier)
+
+    def write_row(self, table, fields, record):
+        """Insert or update one record"""
+        values = [record.get(field) for field in fields]
+        rowid = self.rowids.get((table, record["id"]))
+        if rowid is None:
+            cursor = self.conn.execute(
+                f"INSERT INTO {table} ({', '.join(fields)}) VALUES ({', '.join('?' * len(fields))})",
+                values)
+            self.rowids[(table, record["id"])] = cursor.lastrowid
+        else:
+            self.conn.execute(
+                f"UPDATE {table} SET {', '.join(f + ' = ?' for f in fields)} WHERE pk = ?",
+                values + [rowid])
+
+    def delete_row(self, table, record):
+        """Delete one record"""
+        rowid = self.rowids.pop((table, record["id"]), None)
+        if rowid is not None:
+            self.conn.execute(f"DELETE FROM {table} WHERE pk = ?", (rowid,))
+
+    def put_item(self, item):
+        with self.conn:
+            self.write_row("items", ITEM_FIELDS, item)
+
+    def delete_item(self, item):
+        with self.conn:
+            self.delete_row("items", item)
+
+    def put_supplier(self, supplier):
+        with self.conn:
+            self.write_row("suppliers", SUPPLIER_FIELDS, supplier)
+
+    def delete_supplier(self, supplier):
+        with self.conn:
+            self.delete_row("suppliers", supplier)
+
+    def write_batch(self, changes):
+        """Persist a list of changes in a single transaction"""
+        with self.conn:
+            for method, record in changes:
+                if method.endswith("_item"):
+                    table, fields = "items", ITEM_FIELDS
+                else:
+                    table, fields = "suppliers", SUPPLIER_FIELDS
+                if method.startswith("put_"):
+                    self.write_row(table, fields, record)
+                else:
+                    self.delete_row(table, record)
+
+    def is_empty(self):
+        """Whether the database holds no records and no JSON file was imported yet"""
+        row = self.conn.execute("""
+            SELECT EXISTS (SELECT 1 FROM items)
+                OR EXISTS (SELECT 1 FROM suppliers)
+                OR EXISTS (SELECT 1 FROM meta WHERE key = 'migrated_from')
+        """).fetchone()
+        return not row[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class SnapshotStorage(Storage):
+    """Binary snapshot file opened with mmap (see snapshot.py), plus a journal of changes
+
+    Loading maps the file and reads its header and metadata only; items
+    are built as the application first touches them. Each change appends
+    one line to <path>.journal, replayed on the next load, instead of
+    repacking the snapshot. A full save, or closing once the journal has
+    grown past compact_bytes, writes a new snapshot to <path>.next, which
+    replaces <path> only when nothing maps it any more. Journal lines carry
+    the generation of the snapshot they apply to, so lines a newer snapshot
+    already holds are skipped.
+    """
+
+    def __init__(self, path, compact_bytes=1024 * 1024):
+        self.path = path
+        self.next_path = path + ".next"
+        self.journal_path = path + ".journal"
+        self.compact_bytes = compact_bytes
+        self.inventory = []
+        self.suppliers = []
+        self.snapshot = None
+        self.generation = 0
+        self.loaded = False
+        self.journal = None
+
+    def promote(self):
+        """Move a snapshot written while the old one was mapped into its place"""
+        if os.path.exists(self.next_path):
+            os.replace(self.next_path, self.path)
+
+    def journal_changes(self, generation):
+        """Last journaled change per table and record id on top of a snapshot generation"""
+        changes = {"inventory": {}, "suppliers": {}}
+        if not os.path.exists(self.journal_path):
+            return changes
+        with open(self.journal_path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn last line from an interrupted write
+                    break
+                if entry["generation"] == generation:
+                    changes[entry["table"]][entry["id"]] = entry
+        return changes
+
+    def load(self):
+        # Stores from an earlier load read the old mapping and must not be used after this
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+        self.promote()
+        if os.path.exists(self.path):
+            self.snapshot = Snapshot(self.path)
+            self.generation = self.snapshot.generation
+            stores = {"inventory": SnapshotStore(self.snapshot),
+                      "suppliers": ItemStore.from_dicts(Supplier, self.snapshot.suppliers)}
+        else:
+            self.generation = 0
+            stores = {"inventory": self.inventory_class(), "suppliers": ItemStore()}
+        for table, changes in self.journal_changes(self.generation).items():
+            store = stores[table]
+            for record_id, entry in changes.items():
+                current = store.get(record_id)
+                if entry["op"] == "delete":
+                    if current is not None:
+                        store.remove(current)
+                elif current is None:
+                    store.add(RECORD_CLASSES[table].from_dict(entry["record"]))
+                else:
+                    for field, value in entry["record"].items():
+                        current[field] = value
+        self.loaded = True
+        return stores["inventory"], stores["suppliers"]
+
+    def iter_stored(self, table):
+        """A table's stored records as dicts with the journal applied, changing no file"""
+        path = self.next_path if os.path.exists(self.next_path) else self.path
+        snapshot = Snapshot(path) if os.path.exists(path) else None
+        try:
+            changes = self.journal_changes(snapshot.generation if snapshot is not None else 0)[table]
+            if snapshot is not None:
+                if table == "inventory":
+                    records = (snapshot.record(slot) for slot in range(len(snapshot)))
+                else:
+                    records = snapshot.suppliers
+                for data in records:
+                    entry = changes.pop(data["id"], None)
+                    if entry is None:
+                        yield data
+                    elif entry["op"] == "put":
+                        yield entry["record"]
+            for entry in changes.values():
+                if entry["op"] == "put":
+                    yield entry["record"]
+        finally:
+            if snapshot is not None:
+                snapshot.close()
+
+    def iter_inventory(self):
+        for data in self.iter_stored("inventory"):
+            yield InventoryItem.from_dict(data)
+
+    def write_all(self, inventory, suppliers):
+        # Unbuilt items are copied from the mapping without creating them
+        items = inventory.iter_dicts() if isinstance(inventory, SnapshotStore) else inventory
+        write_snapshot(self.next_path, items, suppliers, self.generation + 1)
+        self.generation += 1
+        # Every journaled change is in the new snapshot now
+        self.close_journal()
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        if self.snapshot is None:
+            self.promote()
+
+    def append(self, table, op, record):
+        """Append one change to the journal"""
+        entry = {"generation": self.generation, "table": table, "op": op, "id": record["id"]}
+        if op == "put":
+            entry["record"] = record
+        if self.journal is None:
+            self.journal = open(self.journal_path, 'a')
+        self.journal.write(json.dumps(entry, default=Record.to_dict) + "\n")
+        self.journal.flush()
+
+    def close_journal(self):
+        """Close the journal file if it is open"""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def put_item(self, item):
+        self.append("inventory", "put", item)
+
+    def delete_item(self, item):
+        self.append("inventory", "delete", item)
+
+    def put_supplier(self, supplier):
+        self.append("suppliers", "put", supplier)
+
+    def delete_supplier(self, supplier):
+        self.append("suppliers", "delete", supplier)
+
+    def close(self):
+        """Fold a long journal into a new snapshot, unmap the file and swap the new one in"""
+        self.close_journal()
+        if not self.loaded:
+            return
+        if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > self.compact_bytes:
+            self.write_all(self.inventory, self.suppliers)
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+        self.promote()
+        self.loaded = False
+
+
+def copy_records(records):
+    """Plain dict copies of a store's records, safe to write while the store changes"""
+    if isinstance(records, SnapshotStore):
+        return list(records.iter_dicts())
+    return [record.to_dict() for record in records]
+
+
+class AsyncWriter(Storage):
+    """Runs another backend's writes on a background thread
+
+    Changes are queued and, after a short delay, written as one coalesced
+    batch, so a burst of edits costs a single write. The UI thread holds
+    lock while it mutates records; the writer holds it only to copy the
+    changed records (or, for a full save, every record) into plain dicts,
+    then serializes and writes the copies without it, so a slow write never
+    blocks the UI. Failed writes are put on errors for the UI to report.
+    """
+
+    def __init__(self, storage, delay=0.2):
+        self.storage = storage
+        self.delay = delay
+        self.lock = threading.RLock()
+        # Latest pending change per record, keyed by object identity
+        self.pending = {}
+        self.full_save = False
+        self.errors = queue.Queue()
+        self.wakeup = threading.Event()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def load(self):
+        return self.storage.load()
+
+    def attach(self, inventory, suppliers):
+        self.storage.attach(inventory, suppliers)
+
+    def save_all(self):
+        with self.lock:
+            self.full_save = True
+            self.pending.clear()
+        self.wakeup.set()
+
+    def queue_change(self, method, record):
+        """Queue a change, replacing an older one for the same record"""
+        with self.lock:
+            self.pending[id(record)] = (method, record)
+        self.wakeup.set()
+
+    def put_item(self, item):
+        self.queue_change("put_item", item)
+
+    def delete_item(self, item):
+        self.queue_change("delete_item", item)
+
+    def put_supplier(self, supplier):
+        self.queue_change("put_supplier", supplier)
+
+    def delete_supplier(self, supplier):
+        self.queue_change("delete_supplier", supplier)
+
+    def write_batch(self, changes):
+        """Queue many changes at once so they are written together"""
+        with self.lock:
+            for method, record in changes:
+                self.pending[id(record)] = (method, record)
+        self.wakeup.set()
+
+    def run(self):
+        """Writer thread: wait for changes, let the burst settle, then write"""
+        while not self.stopping:
+            self.wakeup.wait()
+            if not self.stopping:
+                time.sleep(self.delay)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Write everything queued so far"""
+        data = copies = None
+        with self.lock:
+            changes = list(self.pending.values())
+            self.pending.clear()
+            full_save, self.full_save = self.full_save, False
+            if full_save or (changes and self.storage.rewrites_all):
+                data = copy_records(self.storage.inventory), copy_records(self.storage.suppliers)
+            else:
+                copies = [(method, record.to_dict()) for method, record in changes]
+
+        try:
+            if data is not None:
+                self.storage.write_all(*data)
+            elif copies:
+                self.storage.write_batch(copies)
+        except Exception as error:
+            with self.lock:
+                # Keep the changes queued so the next write retries them
+                self.full_save = self.full_save or full_save
+                for method, record in changes:
+                    self.pending.setdefault(id(record), (method, record))
+            self.errors.put(error)
+
+    def close(self):
+        """Write what is still queued, stop the thread and close the backend"""
+        self.stopping = True
+        self.wakeup.set()
+        self.thread.join()
+        # Changes queued while the last write ran
+        self.flush()
+        self.storage.close()
+
+
+def migrate_json_to_sqlite(json_path, storage):
+    """Import a JSON data file into an empty SQLite storage, once"""
+    if not storage.is_empty() or not os.path.exists(json_path):
+        return False
+    inventory, suppliers = JsonStorage(json_path).load()
+    storage.attach(inventory, suppliers)
+    storage.save_all()
+    storage.rowids.clear()
+    with storage.conn:
+        storage.conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_from', ?)",
+                             (os.path.abspath(json_path),))
+    return True
+
+
+def convert_json_to_snapshot(json_path, snapshot_path):
+    """Write a JSON data file as a snapshot, streaming its inventory"""
+    with open(json_path, 'r') as f:
+        suppliers = list(JsonArrayReader(f).iter_array("suppliers"))
+    write_snapshot(snapshot_path, JsonStorage(json_path).iter_inventory(), suppliers)
+
+
+def convert_snapshot_to_json(snapshot_path, json_path):
+    """Write a snapshot and its journal back as a JSON data file, one item at a time"""
+    storage = SnapshotStorage(snapshot_path)
+    with atomic_write(json_path) as f:
+        f.write('{\n  "inventory": [')
+        for n, data in enumerate(storage.iter_stored("inventory")):
+            f.write(("," if n else "") + "\n    " + json.dumps(data))
+        f.write('\n  ],\n  "suppliers": ')
+        json.dump(list(storage.iter_stored("suppliers")), f, indent=2)
+        f.write("\n}\n")
+
+
+def open_storage(path, legacy_json="inventory_data.json", journal=False, columnar=False, migrate=True):
+    """Pick the backend from the file extension
+
+    .db, .sqlite and .sqlite3 files use SQLite and import legacy_json the
+    first time they are opened; .snapshot files are memory-mapped binary
+    snapshots, converted from legacy_json when they do not exist yet.
+    Without migrate neither import happens, for read-only callers.
+    Anything else is the JSON file format, with an append-only journal
+    when journal is set. With columnar the inventory is loaded into a
+    ColumnarStore (snapshots build their items lazily instead).
+    """
+    extension = os.path.splitext(path)[1]
+    legacy_path = os.path.join(os.path.dirname(path), legacy_json)
+    if extension in (".db", ".sqlite", ".sqlite3"):
+        storage = SqliteStorage(path)
+        if migrate:
+            migrate_json_to_sqlite(legacy_path, storage)
+    elif extension == ".snapshot":
+        if migrate and not os.path.exists(path) and os.path.exists(legacy_path):
+            convert_json_to_snapshot(legacy_path, path)
+        return SnapshotStorage(path)
+    elif journal:
+        storage = JournalStorage(path)
+    else:
+        storage = JsonStorage(path)
+    if columnar:
+        storage.inventory_class = ColumnarStore
+    return storage
+
+
+def open_app_storage():
+    """The application's storage, as configured by the environment
+
+    HARDTRACK_DATA names the data file (default inventory_data.json); a .db
+    path selects the SQLite backend and a .snapshot path the binary snapshot. HARDTRACK_JOURNAL=1 keeps the JSON file
+    with an append-only journal and HARDTRACK_COLUMNAR=1 holds large
+    catalogs in compact columns. Writes go through an AsyncWriter.
+    """
+    return AsyncWriter(open_storage(
+        os.environ.get("HARDTRACK_DATA", "inventory_data.json"),
+        journal=os.environ.get("HARDTRACK_JOURNAL") == "1",
+        columnar=os.environ.get("HARDTRACK_COLUMNAR") == "1"))
@@ -0,0 +1,51 @@
+FONT_FAMILY = "Arial"
+
+# Text colors of the status column, for both items and suppliers
+STATUS_COLORS = {
+    "In Stock": "#00cc88",
+    "Low Stock": "#ffaa00",
+    "Out of Stock": "#ff5555",
+    "Active": "#00cc88",
+    "Inactive": "#ff5555"
+}
+
+# One style sheet for the login and registration forms, parsed once per
+# window instead of once per widget; widgets pick their rules by object name
+QT_FORM_STYLE = """
+* { background-color: #f7fafc; border-radius: 12px; }
+#title { color: #3069f1; margin-top: 8px; margin-bottom: 6px; }
+#subtitle { color: #444; margin-bottom: 10px; }
+#fieldLabel { color: #333; margin-bottom: 1px; }
+#fieldInput {
+    padding: 9px; border-radius: 8px; border: 1px solid #cccccc; margin-bottom: 3px; background: #ffffff
+}
+#lastFieldInput {
+    padding: 9px; border-radius: 8px; border: 1px solid #cccccc; margin-bottom: 8px; background: #ffffff
+}
+#primaryButton {
+    background-color: #3069f1; color: white; padding: 10px; border: none; border-radius: 8px; margin-top: 7px;
+}
+#linkButton { color: #3069f1; background: transparent; border: none; margin-top: 20px; }
+"""
+
+# Fonts are built on first use, so importing this module needs neither Tk nor Qt
+CTK_FONTS = {}
+QT_FONTS = {}
+
+
+def ctk_font(size, weight="normal"):
+    """Shared CTkFont of the app's family; the Tk root must exist"""
+    font = CTK_FONTS.get((size, weight))
+    if font is None:
+        import customtkinter as ctk
+        font = CTK_FONTS[(size, weight)] = ctk.CTkFont(family=FONT_FAMILY, size=size, weight=weight)
+    return font
+
+
+def qt_font(size, bold=False):
+    """Shared QFont of the app's family"""
+    font = QT_FONTS.get((size, bold))
+    if font is None:
+        from PyQt5.QtGui import QFont
+        font = QT_FONTS[(size, bold)] = QFont(FONT_FAMILY, size, QFont.Bold if bold else QFont.Normal)
+    return font
@@ -0,0 +1,191 @@
+import sys
+import tkinter as tk
+from tkinter import ttk
+import customtkinter as ctk
+from theme import ctk_font
+
+# Rows inserted into the tree per event loop turn when showing new data
+INSERT_BATCH = 2000
+
+STYLE = "Hardtrack.Treeview"
+
+
+def configure_style(widget):
+    """Dark ttk style for the table, matching the customtkinter theme"""
+    style = ttk.Style(widget)
+    # The default themes ignore heading and field colors; clam honours them
+    style.theme_use("clam")
+    style.configure(
+        STYLE,
+        background="#252525",
+        fieldbackground="#1a1a1a",
+        foreground="#ffffff",
+        bordercolor="#1a1a1a",
+        borderwidth=0,
+        rowheight=30,
+        font=ctk_font(11)
+    )
+    style.map(STYLE, background=[("selected", "#0088cc")], foreground=[("selected", "#ffffff")])
+    style.configure(
+        STYLE + ".Heading",
+        background="#1a1a1a",
+        foreground="#00a8ff",
+        relief="flat",
+        font=ctk_font(12, "bold")
+    )
+    style.map(STYLE + ".Heading", background=[("active", "#252525")])
+
+
+class TreeTable(ctk.CTkFrame):
+    """Table drawn by a ttk.Treeview, a drop-in alternative to VirtualTable
+
+    Tk keeps the rows itself, so there are no widgets per row; actions run
+    on the selected row from a right-click menu, and a double-click runs the
+    first one. New data is inserted in batches between event loop turns.
+    The tree shows the data in order, so positions in both always agree for
+    the rows inserted so far.
+    """
+
+    def __init__(self, parent, data, columns, widths, row_values, status_column=None,
+                 status_colors=None, actions=None, sort_command=None):
+        super().__init__(parent, fg_color="#1a1a1a", corner_radius=10)
+
+        self.data = data
+        self.row_values = row_values
+        self.status_column = status_column
+        self.actions = actions or []
+
+        # Tree item id per shown item (keyed by object identity) and back
+        self.iids = {}
+        self.items = {}
+        # Rows of data inserted so far, and the scheduled next batch
+        self.loaded = 0
+        self.insert_job = None
+
+        configure_style(self)
+        names = [f"c{i}" for i in range(len(columns))]
+        self.tree = ttk.Treeview(self, columns=names, show="headings", style=STYLE, selectmode="browse")
+        for column, (name, heading, width) in enumerate(zip(names, columns, widths)):
+            self.tree.heading(name, text=heading, anchor="w")
+            if sort_command is not None:
+                self.tree.heading(name, command=lambda c=column: sort_command(c))
+            self.tree.column(name, width=width + 20, minwidth=40, anchor="w")
+        for status, color in (status_colors or {}).items():
+            self.tree.tag_configure(status, foreground=color)
+        self.tree.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.tree.yview)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 3), pady=5)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+
+        self.menu = tk.Menu(self, tearoff=0, bg="#2d2d2d", fg="#ffffff",
+                            activebackground="#0088cc", activeforeground="#ffffff")
+        for text, fg_color, hover_color, command in self.actions:
+            self.menu.add_command(label=text, command=lambda c=command: self.run_action(c))
+        if self.actions:
+            self.tree.bind("<Double-1>", lambda e: self.run_action(self.actions[0][3]))
+            # macOS reports the secondary button as Button-2
+            self.tree.bind("<Button-2>" if sys.platform == "darwin" else "<Button-3>", self.show_menu)
+
+        self.set_data(data)
+
+    @property
+    def top(self):
+        """Position of the first row in view"""
+        return int(self.tree.yview()[0] * self.loaded)
+
+    @top.setter
+    def top(self, index):
+        if self.loaded:
+            self.tree.yview_moveto(index / self.loaded)
+
+    def set_heading(self, column, text):
+        """Change the text of a column heading"""
+        self.tree.heading(f"c{column}", text=text)
+
+    def selected(self):
+        """The item of the selected row, if any"""
+        selection = self.tree.selection()
+        return self.items.get(selection[0]) if selection else None
+
+    def show_menu(self, event):
+        """Select the row under the pointer and open the action menu"""
+        iid = self.tree.identify_row(event.y)
+        if not iid:
+            return
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        self.menu.tk_popup(event.x_root, event.y_root)
+
+    def run_action(self, command):
+        """Run an action on the selected row"""
+        item = self.selected()
+        if item is not None:
+            command(item)
+
+    def row_options(self, item):
+        """Cell values and status tag of an item's row"""
+        values = self.row_values(item)
+        tags = (values[self.status_column],) if self.status_column is not None else ()
+        return values, tags
+
+    def add_row(self, item, index="end"):
+        """Insert a row for an item into the tree, at the end by default"""
+        values, tags = self.row_options(item)
+        iid = self.tree.insert("", index, values=values, tags=tags)
+        self.iids[id(item)] = iid
+        self.items[iid] = item
+
+    def set_data(self, data):
+        """Show a different sequence of items, replacing all rows"""
+        if self.insert_job is not None:
+            self.after_cancel(self.insert_job)
+            self.insert_job = None
+        self.data = data
+        if self.items:
+            self.tree.delete(*self.items)
+        self.iids = {}
+        self.items = {}
+        self.loaded = 0
+        self.insert_batch()
+
+    def insert_batch(self):
+        """Insert the next batch of rows, scheduling another while rows are left"""
+        self.insert_job = None
+        stop = min(len(self.data), self.loaded + INSERT_BATCH)
+        for index in range(self.loaded, stop):
+            self.add_row(self.data[index])
+        self.loaded = stop
+        if stop < len(self.data):
+            self.insert_job = self.after(1, self.insert_batch)
+
+    def update_row(self, item, index=None):
+        """Rewrite the row of an edited item
+
+        An index means the item moved to that position of the data.
+        """
+        if index is not None:
+            self.remove_row(item)
+            self.insert_row(item, index)
+            return
+        iid = self.iids.get(id(item))
+        if iid is not None:
+            values, tags = self.row_options(item)
+            self.tree.item(iid, values=values, tags=tags)
+
+    def insert_row(self, item, index=None):
+        """Show a row added to the data, at the end unless an index is given"""
+        if index is None:
+            index = len(self.data) - 1
+        if index <= self.loaded:
+            self.add_row(item, index)
+            self.loaded += 1
+        # Otherwise the pending batches reach it
+
+    def remove_row(self, item):
+        """Drop the row of an item removed from the data"""
+        iid = self.iids.pop(id(item), None)
+        if iid is not None:
+            del self.items[iid]
+            self.tree.delete(iid)
+            self.loaded -= 1
@@ -0,0 +1,71 @@
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+
+from atomic_file import atomic_write
+
+# PBKDF2-SHA256 rounds for new passwords; HARDTRACK_KDF_ITERATIONS overrides it
+DEFAULT_ITERATIONS = 600_000
+
+
+class UserStore:
+    """Users and their salted PBKDF2-SHA256 password hashes, kept in a JSON file
+
+    The file is read once into a dict keyed by username, so lookups never
+    touch the disk. Each user keeps the iteration count their hash was made
+    with, so raising the cost only affects passwords set afterwards.
+    Hashing is slow on purpose; call verify() and add_user() off the GUI thread.
+    """
+
+    def __init__(self, path="users.json", iterations=None):
+        self.path = path
+        self.iterations = iterations or int(os.environ.get("HARDTRACK_KDF_ITERATIONS", DEFAULT_ITERATIONS))
+        self.lock = threading.Lock()
+        self.users = {}
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                self.users = json.load(f)
+        # Checked against for unknown names, so they cost as much as a wrong password
+        self.missing_user = {"salt": "00" * 16, "hash": "00" * 32, "iterations": self.iterations}
+
+    def __contains__(self, username):
+        return username in self.users
+
+    def __len__(self):
+        return len(self.users)
+
+    @staticmethod
+    def hash_password(password, salt, iterations):
+        """PBKDF2-SHA256 digest of a password"""
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+
+    def add_user(self, username, password, role="user"):
+        """Register a user and save the file; raises KeyError if the name is taken"""
+        salt = secrets.token_bytes(16)
+        record = {
+            "salt": salt.hex(),
+            "hash": self.hash_password(password, salt, self.iterations).hex(),
+            "iterations": self.iterations,
+            "role": role
+        }
+        with self.lock:
+            if username in self.users:
+                raise KeyError(f"Username {username!r} already exists")
+            self.users[username] = record
+            self.save()
+
+    def verify(self, username, password):
+        """Role of the user if the password is right, otherwise None"""
+        record = self.users.get(username, self.missing_user)
+        digest = self.hash_password(password, bytes.fromhex(record["salt"]), record["iterations"])
+        if hmac.compare_digest(digest, bytes.fromhex(record["hash"])) and username in self.users:
+            return record["role"]
+        return None
+
+    def save(self):
+        """Atomically rewrite the users file, readable by its owner only"""
+        with atomic_write(self.path, permissions=0o600) as f:
+            json.dump(self.users, f, indent=2)
@@ -0,0 +1,189 @@
+import sys
+import customtkinter as ctk
+from theme import ctk_font
+
+
+class VirtualTable(ctk.CTkFrame):
+    """Scrollable table that reuses a fixed pool of row widgets for the visible rows only"""
+
+    # Vertical padding around each row frame; pack padding is not scaled by customtkinter
+    ROW_PADY = 5
+
+    def __init__(self, parent, data, widths, row_values, status_column=None,
+                 status_colors=None, actions=None):
+        super().__init__(parent, fg_color="#1a1a1a", corner_radius=10)
+
+        self.data = data
+        self.widths = widths
+        self.row_values = row_values
+        self.status_column = status_column
+        self.status_colors = status_colors or {}
+        self.actions = actions or []
+
+        # Index of the first data row shown in the viewport
+        self.top = 0
+        self.visible_rows = 0
+        self.rows = []
+        # Screen height of one row including its padding, measured from the first row
+        self.row_height = None
+
+        self.rows_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.rows_frame.pack(side="left", fill="both", expand=True, padx=(5, 0), pady=5)
+        self.rows_frame.pack_propagate(False)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 3), pady=5)
+
+        self.rows_frame.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.rows_frame)
+
+    def bind_wheel(self, widget):
+        """Route mouse wheel events on a widget to the table"""
+        widget.bind("<MouseWheel>", self.on_mousewheel, add="+")
+        widget.bind("<Button-4>", lambda e: self.scroll_rows(-3), add="+")
+        widget.bind("<Button-5>", lambda e: self.scroll_rows(3), add="+")
+
+    def create_row(self):
+        """Create one pooled row with its labels and action buttons"""
+        row_frame = ctk.CTkFrame(self.rows_frame, fg_color="#252525", corner_radius=5)
+        row_frame.item = None
+        row_frame.cells = []
+        row_frame.texts = []
+        self.bind_wheel(row_frame)
+
+        for width in self.widths:
+            label = ctk.CTkLabel(
+                row_frame,
+                text="",
+                font=ctk_font(11),
+                text_color="#ffffff",
+                width=width
+            )
+            label.pack(side="left", padx=10, pady=12)
+            self.bind_wheel(label)
+            row_frame.cells.append(label)
+            row_frame.texts.append(None)
+
+        for text, fg_color, hover_color, command in self.actions:
+            btn = ctk.CTkButton(
+                row_frame,
+                text=text,
+                font=ctk_font(10),
+                width=40,
+                height=25,
+                fg_color=fg_color,
+                hover_color=hover_color,
+                command=lambda r=row_frame, c=command: r.item is not None and c(r.item)
+            )
+            btn.pack(side="left", padx=5, pady=12)
+            self.bind_wheel(btn)
+
+        return row_frame
+
+    def measure_row_height(self):
+        """Screen height of a laid out row plus its padding, at the current scaling"""
+        if not self.rows:
+            self.rows.append(self.create_row())
+        row_frame = self.rows[0]
+        # Lay the row out so its requested height reflects the scaled widgets
+        row_frame.update_idletasks()
+        return row_frame.winfo_reqheight() + 2 * self.ROW_PADY
+
+    def on_resize(self, event):
+        """Grow the row pool to fit the viewport height"""
+        if self.row_height is None:
+            self.row_height = self.measure_row_height()
+        visible_rows = max(1, event.height // self.row_height)
+        if visible_rows == self.visible_rows:
+            return
+        self.visible_rows = visible_rows
+        while len(self.rows) < visible_rows:
+            self.rows.append(self.create_row())
+        self.render()
+
+    def set_data(self, data):
+        """Show a different sequence of items, keeping the scroll position when possible"""
+        self.data = data
+        self.render()
+
+    def update_row(self, item, index=None):
+        """Redraw the row showing an item, if it is in view
+
+        An index means the item moved to that position of the data.
+        """
+        if index is not None:
+            self.render()
+            return
+        for row_frame in self.rows:
+            if row_frame.item is item:
+                self.fill_row(row_frame, item)
+                break
+
+    def insert_row(self, item, index=None):
+        """Show a row added to the data, at the end unless an index is given"""
+        self.render()
+
+    def remove_row(self, item):
+        """Drop a row removed from the data without moving the rows in view"""
+        first = self.rows[0].item if self.rows else None
+        if (first is not None and first is not item and 0 < self.top < len(self.data)
+                and self.data[self.top] is not first):
+            # The removed row was above the viewport
+            self.top -= 1
+        self.render()
+
+    def render(self):
+        """Bind the pooled row widgets to the rows currently in view"""
+        total = len(self.data)
+        self.top = max(0, min(self.top, total - self.visible_rows))
+
+        for i, row_frame in enumerate(self.rows):
+            index = self.top + i
+            if i >= self.visible_rows or index >= total:
+                if row_frame.winfo_manager():
+                    row_frame.pack_forget()
+                row_frame.item = None
+                continue
+
+            item = self.data[index]
+            self.fill_row(row_frame, item)
+            if not row_frame.winfo_manager():
+                row_frame.pack(fill="x", padx=5, pady=self.ROW_PADY)
+
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def fill_row(self, row_frame, item):
+        """Write an item's values into a pooled row, skipping unchanged cells"""
+        row_frame.item = item
+        for column, (label, value) in enumerate(zip(row_frame.cells, self.row_values(item))):
+            if row_frame.texts[column] == value:
+                continue
+            row_frame.texts[column] = value
+            if column == self.status_column:
+                label.configure(text=value, text_color=self.status_colors.get(value, "#ffffff"))
+            else:
+                label.configure(text=value)
+
+    def scroll_rows(self, count):
+        """Scroll by a number of rows"""
+        self.top += count
+        self.render()
+
+    def yview(self, *args):
+        """Scrollbar callback following the Tk yview protocol"""
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.data))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.render()
+
+    def on_mousewheel(self, event):
+        """Scroll on mouse wheel (Windows and macOS deltas)"""
+        if sys.platform == "darwin":
+            self.scroll_rows(-event.delta)
+        else:
+            self.scroll_rows(-int(event.delta / 120) * 3)
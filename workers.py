@@ -0,0 +1,37 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals a Worker delivers to slots on the GUI thread"""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+
+
+class Worker(QRunnable):
+    """Runs a function on a QThreadPool thread and signals its result or exception"""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as error:
+            self.signals.failed.emit(error)
+        else:
+            self.signals.finished.emit(result)
+
+
+def start_worker(fn, *args, on_finished=None, on_failed=None):
+    """Run fn(*args) on the global thread pool; keep the returned worker alive until it reports"""
+    worker = Worker(fn, *args)
+    if on_finished is not None:
+        worker.signals.finished.connect(on_finished)
+    if on_failed is not None:
+        worker.signals.failed.connect(on_failed)
+    QThreadPool.globalInstance().start(worker)
+    return worker